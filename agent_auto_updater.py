@@ -6,19 +6,152 @@ Automatically updates agent patterns and capabilities based on learning
 
 import os
 import json
+import re
 import datetime
+import hashlib
 import shutil
+import tempfile
+import time
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Tuple
 import importlib.util
 
+try:
+    import orjson  # optional, faster serializer
+except ImportError:
+    orjson = None
+
+
+_confidence = itemgetter('confidence')
+_frequency = itemgetter('frequency')
+
+# Fingerprint at the end of a pattern table written by _update_agent_modules
+_TABLE_HASH_RE = re.compile(rb'"hash": "([0-9a-f]+)"\}\s*\Z')
+
+# "Replace '<old>' with '<new>'" fix suggestions
+_FIX_RE = re.compile(r"Replace '(?P<old>.*?)' with '(?P<new>.*?)'*\Z", re.DOTALL)
+
+def _source_hash(text: str) -> bytes:
+    """Digest of a source file's text, used both to skip re-integration and to detect concurrent edits"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def _now_stamp() -> str:
+    """Local time as YYYYmmdd_HHMMSS, formatted in C without building a datetime"""
+    return time.strftime("%Y%m%d_%H%M%S")
+
+
+class ConcurrentModificationError(Exception):
+    """Raised when a file changed on disk between reading and rewriting it"""
+
+
+def _copy_file(src, dst):
+    """Copy file contents in kernel space, reflinking where the filesystem allows"""
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            pass  # Unsupported here (e.g. cross-device), use the portable path
+    
+    # copyfile itself uses sendfile on Linux
+    shutil.copyfile(src, dst)
+
+
+def _atomic_write(path, data, skip_if=None, fsync: bool = True) -> bool:
+    """Write text (a str or an iterable of str chunks) to a temp file and rename it into place
+    
+    skip_if is checked once everything is written; when it returns True the temp
+    file is discarded and the existing file kept. Returns whether path was replaced.
+    """
+    
+    path = Path(path)
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    chunks = [data] if isinstance(data, str) else data
+    
+    # Linux: an unnamed O_TMPFILE inode vanishes by itself if we die mid-write,
+    # and only gets a name (linked via /proc) once it is complete
+    if hasattr(os, 'O_TMPFILE') and os.path.isdir('/proc/self/fd'):
+        try:
+            fd = os.open(path.parent, os.O_TMPFILE | os.O_RDWR, mode)
+        except OSError:
+            fd = None  # Filesystem without O_TMPFILE support
+        
+        if fd is not None:
+            tmp_name = path.parent / f".{path.name}.{os.getpid()}.{time.time_ns()}.tmp"
+            with os.fdopen(fd, 'w+', encoding='utf-8') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                if skip_if is not None and skip_if():
+                    return False
+                f.flush()
+                os.fchmod(f.fileno(), mode)
+                if fsync:
+                    os.fsync(f.fileno())
+                try:
+                    os.link(f"/proc/self/fd/{f.fileno()}", tmp_name)
+                    linked = True
+                except OSError:
+                    # Some filesystems refuse the /proc link; replay via a named temp file
+                    f.seek(0)
+                    chunks = [f.read()]
+                    skip_if = None
+                    linked = False
+            if linked:
+                try:
+                    os.replace(tmp_name, path)
+                except BaseException:
+                    os.unlink(tmp_name)
+                    raise
+                return True
+    
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            if skip_if is not None and skip_if():
+                f.close()
+                os.unlink(tmp_name)
+                return False
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+        return True
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
 class AgentAutoUpdater:
     """Automatically updates agent code with learned patterns"""
     
-    def __init__(self, agent_modules_dir: str = "modules"):
+    def __init__(self, agent_modules_dir: str = "modules", max_backups: int = 20):
         self.modules_dir = Path(agent_modules_dir)
         self.learning_dir = Path("learning_data")
         self.backup_dir = Path("agent_backups")
+        self.max_backups = max_backups
+        self.update_log_file = self.learning_dir / "update_history.jsonl"
+        self.legacy_update_log_file = self.learning_dir / "update_history.json"
+        
+        # Parsed JSON files keyed by path, invalidated on mtime change
+        self._json_cache: Dict[Path, Tuple[int, object]] = {}
+        
+        # (mtime_ns, size, record) for the newest update history entry
+        self._last_update_cache = None
+        
+        # Hash of the agent source last seen fully integrated
+        self._integrated_agent_hash = None
         
         # Create directories if they don't exist
         self.backup_dir.mkdir(exist_ok=True)
@@ -29,14 +162,11 @@ class AgentAutoUpdater:
         print("🔄 Auto-Updating CI/CD Agent Patterns...")
         
         # Load learned patterns
-        patterns_file = self.learning_dir / "learned_patterns.json"
-        if not patterns_file.exists():
+        learned_patterns = self._load_learned_patterns()
+        if learned_patterns is None:
             print("❌ No learned patterns found")
             return False
         
-        with open(patterns_file, 'r') as f:
-            learned_patterns = json.load(f)
-        
         if not learned_patterns:
             print("ℹ️  No patterns to update")
             return False
@@ -48,7 +178,12 @@ class AgentAutoUpdater:
         new_fixes = self._generate_pattern_fixes(learned_patterns)
         
         # Update agent modules
-        success = self._update_agent_modules(new_fixes)
+        try:
+            success = self._update_agent_modules(new_fixes)
+        except ConcurrentModificationError as e:
+            # Restoring the backup would clobber the concurrent edit as well
+            print(f"⚠️  {e}, update skipped")
+            return False
         
         if success:
             print(f"✅ Agent updated with {len(learned_patterns)} new patterns")
@@ -62,8 +197,7 @@ class AgentAutoUpdater:
     def _backup_current_agent(self):
         """Create backup of current agent code"""
         
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = self.backup_dir / f"agent_backup_{timestamp}"
+        backup_path = self.backup_dir / f"agent_backup_{_now_stamp()}"
         backup_path.mkdir(exist_ok=True)
         
         # Backup key files
@@ -75,102 +209,82 @@ class AgentAutoUpdater:
         
         for file_path in files_to_backup:
             if Path(file_path).exists():
-                shutil.copy2(file_path, backup_path / Path(file_path).name)
+                _copy_file(file_path, backup_path / Path(file_path).name)
         
         print(f"💾 Backup created: {backup_path}")
     
-    def _generate_pattern_fixes(self, patterns: Dict) -> List[str]:
-        """Generate Python code for new pattern fixes"""
+    def _generate_pattern_fixes(self, patterns: Dict) -> Iterator[str]:
+        """Generate pattern table entries for new pattern fixes"""
         
-        fix_methods = []
-        
-        for pattern_key, pattern_data in patterns.items():
-            if pattern_data['confidence'] < 0.7:
+        for pattern_data in patterns.values():
+            if _confidence(pattern_data) < 0.7:
                 continue  # Skip low-confidence patterns
             
-            method_name = self._generate_method_name(pattern_data)
-            fix_code = self._generate_fix_method(pattern_data, method_name)
-            
-            fix_methods.append(fix_code)
-        
-        return fix_methods
+            yield self._generate_fix_entry(pattern_data)
     
-    def _generate_method_name(self, pattern_data: Dict) -> str:
-        """Generate a valid Python method name from pattern"""
-        
-        error_text = pattern_data['error_text']
-        category = pattern_data['category']
-        
-        # Clean up for method name
-        clean_name = error_text.replace('-', '_').replace('/', '_').replace('@', '_').replace('.', '_')
-        clean_name = ''.join(c for c in clean_name if c.isalnum() or c == '_')
-        
-        return f"_fix_{category}_{clean_name}"[:50]  # Limit length
-    
-    def _generate_fix_method(self, pattern_data: Dict, method_name: str) -> str:
-        """Generate complete fix method code"""
+    def _generate_fix_entry(self, pattern_data: Dict) -> str:
+        """Generate a single {old, new, confidence} pattern table row as JSON"""
         
         error_text = pattern_data['error_text']
         fix_suggestion = pattern_data['fix_suggestion']
         
         # Extract replacement from fix suggestion
-        if "Replace '" in fix_suggestion and "' with '" in fix_suggestion:
-            parts = fix_suggestion.split("' with '")
-            old_text = parts[0].split("Replace '")[1]
-            new_text = parts[1].rstrip("'")
+        match = _FIX_RE.search(fix_suggestion)
+        if match:
+            old_text, new_text = match['old'], match['new']
         else:
             old_text = error_text
             new_text = f"FIXED_{error_text}"
         
-        return f'''
-    def {method_name}(self, content: str) -> str:
-        """Auto-generated fix for {error_text} (confidence: {pattern_data['confidence']:.1f})"""
-        if '{old_text}' in content:
-            content = content.replace('{old_text}', '{new_text}')
-            self.fixes_applied.append("Auto-learned: {old_text} → {new_text}")
-        return content'''
+        return json.dumps({'old': old_text, 'new': new_text, 'confidence': pattern_data['confidence']})
     
-    def _update_agent_modules(self, new_fixes: List[str]) -> bool:
-        """Update agent modules with new fix methods"""
+    def _update_agent_modules(self, new_fixes: Iterable[str]) -> bool:
+        """Write the new pattern table and integrate the loader into the agent"""
         
         try:
-            # Create enhanced error detector module
-            enhanced_module_path = self.modules_dir / "auto_learned_fixes.py"
+            # Pattern table read by the stable modules/auto_learned_fixes.py loader
+            patterns_path = self.modules_dir / "auto_learned_patterns.json"
             
-            module_content = f'''"""
-Auto-generated fixes based on continuous learning
-Generated: {datetime.datetime.now().isoformat()}
-Total patterns: {len(new_fixes)}
-"""
-
-class AutoLearnedFixes:
-    """Auto-generated fix methods from continuous learning"""
-    
-    def __init__(self):
-        self.fixes_applied = []
-    
-    def apply_all_learned_fixes(self, content: str) -> str:
-        """Apply all auto-learned fixes"""
-        for method_name in dir(self):
-            if method_name.startswith('_fix_'):
-                method = getattr(self, method_name)
-                content = method(content)
-        return content
-{''.join(new_fixes)}
-'''
+            # Fingerprint the rows before touching any file
+            rows = list(new_fixes)
+            hasher = hashlib.blake2b(digest_size=16)
+            for row in rows:
+                hasher.update(row.encode('utf-8'))
+            table_hash = hasher.hexdigest()
             
-            with open(enhanced_module_path, 'w', encoding='utf-8') as f:
-                f.write(module_content)
+            # Unchanged tables leave the existing file in place
+            if table_hash != self._read_table_hash(patterns_path):
+                _atomic_write(patterns_path, (
+                    f'{{"generated": "{datetime.datetime.now().isoformat()}", "patterns": [\n'
+                    + ",\n".join(rows)
+                    + f'\n], "hash": "{table_hash}"}}\n'
+                ))
             
             # Update main enterprise agent to include auto-learned fixes
             self._integrate_learned_fixes()
             
             return True
             
+        except ConcurrentModificationError:
+            raise
         except Exception as e:
             print(f"❌ Error updating modules: {e}")
             return False
     
+    def _read_table_hash(self, table_path: Path):
+        """Read the fingerprint of a previously written pattern table from its tail"""
+        
+        try:
+            with open(table_path, 'rb') as f:
+                f.seek(max(0, os.fstat(f.fileno()).st_size - 128))
+                tail = f.read()
+        except FileNotFoundError:
+            return None
+        
+        # Truncated or hand-edited tables have no trailing hash and get rewritten
+        match = _TABLE_HASH_RE.search(tail)
+        return match.group(1).decode('ascii') if match else None
+    
     def _integrate_learned_fixes(self):
         """Integrate learned fixes into main agent"""
         
@@ -182,91 +296,111 @@ class AutoLearnedFixes:
         with open(agent_file, 'r') as f:
             agent_code = f.read()
         
-        # Check if auto-learned fixes are already integrated
-        if "auto_learned_fixes" in agent_code.lower():
+        # Unchanged since it was last integrated, skip the walk
+        code_hash = _source_hash(agent_code)
+        if code_hash == self._integrated_agent_hash:
             return
         
-        # Find the class definition and add import
-        import_line = "from modules.auto_learned_fixes import AutoLearnedFixes"
-        if import_line not in agent_code:
-            # Add import after existing imports
-            lines = agent_code.splitlines()
-            import_inserted = False
-            
-            for i, line in enumerate(lines):
-                if line.startswith("import ") or line.startswith("from "):
-                    continue
-                else:
-                    lines.insert(i, import_line)
-                    import_inserted = True
-                    break
-            
-            if import_inserted:
-                agent_code = '\n'.join(lines)
-        
-        # Add initialization in __init__ method
-        init_line = "        self.auto_fixes = AutoLearnedFixes()"
-        if init_line not in agent_code:
-            agent_code = agent_code.replace(
-                "self.fixes_applied = []",
-                "self.fixes_applied = []\n" + init_line
-            )
-        
-        # Add auto-learned fixes to fix_production_pipeline method
-        auto_fix_call = "            current_content = self._apply_auto_learned_fixes,"
-        if auto_fix_call not in agent_code:
-            # Find the fixes list and add our method
-            agent_code = agent_code.replace(
-                "fixes = [",
-                "fixes = [\n                self._apply_auto_learned_fixes,"
-            )
-        
-        # Add the method if it doesn't exist
-        auto_fix_method = '''
-    def _apply_auto_learned_fixes(self, content: str) -> str:
-        """Apply automatically learned fixes"""
+        import_line = "from modules.auto_learned_fixes import AutoLearnedFixes\n"
+        init_line = "        self.auto_fixes = AutoLearnedFixes(fixes_log=self.fixes_applied)\n"
+        fixes_entry = "                self._apply_auto_learned_fixes,\n"
+        auto_fix_method = '''    def _apply_auto_learned_fixes(self, content: str) -> str:
+        """Apply automatically learned fixes (logged straight into self.fixes_applied)"""
         try:
-            before_content = content
-            content = self.auto_fixes.apply_all_learned_fixes(content)
-            
-            # Merge fix logs
-            if hasattr(self.auto_fixes, 'fixes_applied'):
-                self.fixes_applied.extend(self.auto_fixes.fixes_applied)
-                self.auto_fixes.fixes_applied = []
-            
-            return content
+            return self.auto_fixes.apply_all_learned_fixes(content)
         except Exception as e:
             print(f"⚠️  Auto-learned fixes failed: {e}")
             return content
+
 '''
         
-        if "_apply_auto_learned_fixes" not in agent_code:
-            # Add method before the last method or end of class
-            agent_code = agent_code.replace(
-                "    def _enterprise_cleanup",
-                auto_fix_method + "\n    def _enterprise_cleanup"
-            )
+        # Single walk recording what is already integrated and where to insert
+        lines = agent_code.splitlines(keepends=True)
+        has_import = has_init = has_fixes_entry = has_method = False
+        seen_definition = False
+        import_idx = 0
+        init_idx = fixes_idx = method_idx = None
+        
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            
+            if line.startswith(("import ", "from ")):
+                has_import = has_import or stripped == import_line.strip()
+                if not seen_definition:
+                    import_idx = i + 1  # After the last top-level import
+            elif line.startswith(("class ", "def ")):
+                seen_definition = True
+            elif stripped == init_line.strip():
+                has_init = True
+            elif stripped == fixes_entry.strip():
+                has_fixes_entry = True
+            elif line.startswith("    def _apply_auto_learned_fixes"):
+                has_method = True
+            elif init_idx is None and stripped == "self.fixes_applied = []":
+                init_idx = i + 1
+            elif fixes_idx is None and stripped == "fixes = [":
+                fixes_idx = i + 1
+            elif method_idx is None and line.startswith("    def _enterprise_cleanup"):
+                method_idx = i
+        
+        inserts: Dict[int, List[str]] = {}
+        if not has_import:
+            inserts.setdefault(import_idx, []).append(import_line)
+        if not has_init and init_idx is not None:
+            inserts.setdefault(init_idx, []).append(init_line)
+        if not has_fixes_entry and fixes_idx is not None:
+            inserts.setdefault(fixes_idx, []).append(fixes_entry)
+        if not has_method and method_idx is not None:
+            inserts.setdefault(method_idx, []).append(auto_fix_method)
+        
+        # Already integrated, leave the file untouched
+        if not inserts:
+            self._integrated_agent_hash = code_hash
+            return
+        
+        pieces = []
+        previous = 0
+        for idx in sorted(inserts):
+            pieces.extend(lines[previous:idx])
+            pieces.extend(inserts[idx])
+            previous = idx
+        pieces.extend(lines[previous:])
+        
+        agent_code = ''.join(pieces)
+        
+        # Refuse to overwrite edits made since the file was read
+        with open(agent_file, 'r') as f:
+            disk_hash = _source_hash(f.read())
+        if disk_hash != code_hash:
+            raise ConcurrentModificationError(f"{agent_file} was modified during the update")
         
         # Write updated agent code
-        with open(agent_file, 'w') as f:
-            f.write(agent_code)
+        _atomic_write(agent_file, agent_code)
+        
+        self._integrated_agent_hash = _source_hash(agent_code)
     
     def _restore_from_backup(self):
         """Restore agent from backup in case of failure"""
         
-        # Find latest backup
-        backups = sorted(self.backup_dir.glob("agent_backup_*"))
+        # Find latest backup by mtime, reusing the directory entries' stat data
+        with os.scandir(self.backup_dir) as it:
+            backups = [e for e in it if e.name.startswith("agent_backup_") and e.is_dir()]
         if not backups:
             print("❌ No backups found for restoration")
             return
         
-        latest_backup = backups[-1]
+        backups.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+        latest_backup = backups[0].path
+        
+        # Prune backups beyond the retention limit
+        for old_backup in backups[self.max_backups:]:
+            shutil.rmtree(old_backup.path, ignore_errors=True)
         
         # Restore files
-        for backup_file in latest_backup.glob("*.py"):
-            original_path = Path(backup_file.name)
-            if original_path.exists():
-                shutil.copy2(backup_file, original_path)
+        with os.scandir(latest_backup) as entries:
+            for entry in entries:
+                if entry.name.endswith('.py') and os.path.exists(entry.name):
+                    _copy_file(entry.path, entry.name)
         
         print(f"🔄 Restored from backup: {latest_backup}")
     
@@ -274,46 +408,125 @@ class AutoLearnedFixes:
         """Log the update for tracking"""
         
         update_log = {
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp_ns': time.time_ns(),  # Formatted as ISO only when read
             'patterns_count': len(patterns),
             'patterns': list(patterns.keys()),
             'version': self._get_next_version()
         }
         
-        log_file = self.learning_dir / "update_history.json"
-        
-        # Load existing log
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                history = json.load(f)
+        # Append-only JSONL, one record per update
+        if orjson is not None:
+            record = orjson.dumps(update_log) + b'\n'
         else:
-            history = []
-        
-        history.append(update_log)
+            record = json.dumps(update_log).encode('utf-8') + b'\n'
         
-        # Save updated log
-        with open(log_file, 'w') as f:
-            json.dump(history, f, indent=2)
+        with open(self.update_log_file, 'ab') as f:
+            f.write(record)
         
         print(f"📝 Update logged: Version {update_log['version']}")
     
     def _get_next_version(self) -> str:
         """Get next version number for the agent"""
         
-        log_file = self.learning_dir / "update_history.json"
+        last_update = self._read_last_update()
+        
+        if last_update:
+            last_version = last_update['version']
+            # Simple version increment
+            version_parts = last_version.split('.')
+            version_parts[-1] = str(int(version_parts[-1]) + 1)
+            return '.'.join(version_parts)
+        
+        return "1.0.0"  # Initial version
+    
+    def _format_update_time(self, record: Dict) -> str:
+        """ISO timestamp of an update record"""
+        
+        if 'timestamp_ns' in record:
+            return datetime.datetime.fromtimestamp(record['timestamp_ns'] / 1e9).isoformat()
+        return record['timestamp']
+    
+    def _migrate_legacy_history(self):
+        """Convert the pre-JSONL update_history.json list into the JSONL log, once"""
+        
+        if self.update_log_file.exists() or not self.legacy_update_log_file.exists():
+            return
+        
+        try:
+            with open(self.legacy_update_log_file, 'r') as f:
+                history = json.load(f)
+        except ValueError:
+            print(f"⚠️  Unreadable {self.legacy_update_log_file}, starting a new update history")
+            return
+        
+        # Records keep their ISO 'timestamp', which _format_update_time still reads
+        _atomic_write(self.update_log_file, (json.dumps(record) + '\n' for record in history))
+        print(f"📝 Migrated {len(history)} updates from {self.legacy_update_log_file}")
+    
+    def _read_last_update(self):
+        """Read the last update record from the tail of the log, or None"""
+        
+        self._migrate_legacy_history()
         
+        try:
+            st = self.update_log_file.stat()
+        except FileNotFoundError:
+            return None
+        
+        # Log unchanged since last read, no need to open it
+        cached = self._last_update_cache
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        
+        with open(self.update_log_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            block = 4096
+            while True:
+                start = max(0, size - block)
+                f.seek(start)
+                tail = f.read().rstrip()
+                # Widen the window until it holds the whole last line
+                if b'\n' in tail or start == 0:
+                    break
+                block *= 2
+        
+        last_line = tail.rsplit(b'\n', 1)[-1]
+        record = json.loads(last_line) if last_line else None
+        
+        self._last_update_cache = (st.st_mtime_ns, st.st_size, record)
+        return record
+    
+    def _load_learned_patterns(self):
+        """Learned patterns snapshot with the learning agent's update log replayed over it"""
+        
+        patterns_file = self.learning_dir / "learned_patterns.json"
+        log_file = self.learning_dir / "learned_patterns.jsonl"
+        if not patterns_file.exists() and not log_file.exists():
+            return None
+        
+        patterns = dict(self._load_json(patterns_file)) if patterns_file.exists() else {}
         if log_file.exists():
             with open(log_file, 'r') as f:
-                history = json.load(f)
-            
-            if history:
-                last_version = history[-1]['version']
-                # Simple version increment
-                version_parts = last_version.split('.')
-                version_parts[-1] = str(int(version_parts[-1]) + 1)
-                return '.'.join(version_parts)
+                for line in f:
+                    try:
+                        patterns.update(json.loads(line))
+                    except ValueError:
+                        break  # Torn final line from an interrupted append
+        return patterns
+    
+    def _load_json(self, path: Path):
+        """Load a JSON file, reusing the parsed value while its mtime is unchanged"""
         
-        return "1.0.0"  # Initial version
+        mtime = path.stat().st_mtime_ns
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(path, 'r') as f:
+            data = json.load(f)
+        
+        self._json_cache[path] = (mtime, data)
+        return data
     
     def schedule_auto_updates(self, enabled: bool = True) -> bool:
         """Enable/disable scheduled auto-updates"""
@@ -324,9 +537,9 @@ class AutoLearnedFixes:
             'update_frequency_hours': 24  # Check daily
         }
         
+        # Cheap to regenerate, so no fsync
         config_file = self.learning_dir / "auto_update_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        _atomic_write(config_file, json.dumps(config, indent=2), fsync=False)
         
         status = "enabled" if enabled else "disabled"
         print(f"🔧 Auto-updates {status}")
@@ -336,28 +549,19 @@ class AutoLearnedFixes:
     def check_for_updates(self) -> Dict:
         """Check if agent needs updates based on new patterns"""
         
-        patterns_file = self.learning_dir / "learned_patterns.json"
-        update_log_file = self.learning_dir / "update_history.json"
-        
-        if not patterns_file.exists():
+        # Snapshot plus the learning agent's update log, which holds everything since compaction
+        patterns = self._load_learned_patterns()
+        if not patterns:
             return {'needs_update': False, 'reason': 'No patterns found'}
         
-        # Load patterns
-        with open(patterns_file, 'r') as f:
-            patterns = json.load(f)
-        
-        # Load update history
-        if update_log_file.exists():
-            with open(update_log_file, 'r') as f:
-                history = json.load(f)
-            last_update = history[-1]['timestamp'] if history else None
-        else:
-            last_update = None
+        # Last update from the history tail
+        last_record = self._read_last_update()
+        last_update = self._format_update_time(last_record) if last_record else None
         
         # Check if there are new high-confidence patterns
         high_confidence_patterns = [
-            p for p in patterns.values() 
-            if p['confidence'] >= 0.7 and p['frequency'] >= 3
+            p for p in patterns.values()
+            if _confidence(p) >= 0.7 and _frequency(p) >= 3
         ]
         
         if len(high_confidence_patterns) >= 5:  # Threshold for update
@@ -381,7 +585,9 @@ Runs automatic updates based on learned patterns
 """
 
 import time
-import schedule
+import asyncio
+import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from agent_auto_updater import AgentAutoUpdater
 
 def run_auto_update_check():
@@ -441,37 +647,75 @@ jobs:
     except Exception as e:
         print(f"❌ Error testing updated agent: {e}")
 
+def _next_run(now, hour, weekday=None):
+    """Next local wall-clock time at hour:00, optionally on a given weekday (Monday=0)"""
+    
+    candidate = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if weekday is None:
+        days_ahead = 0 if candidate > now else 1
+    else:
+        days_ahead = (weekday - now.weekday()) % 7
+        if days_ahead == 0 and candidate <= now:
+            days_ahead = 7
+    
+    return candidate + datetime.timedelta(days=days_ahead)
+
+async def _run_schedule(jobs):
+    """Sleep until the next job deadline, run the due jobs, repeat"""
+    
+    loop = asyncio.get_running_loop()
+    now = datetime.datetime.now()
+    
+    while True:
+        runs = [(_next_run(now, hour, weekday), job) for job, hour, weekday in jobs]
+        next_time = min(run_time for run_time, _ in runs)
+        
+        # mktime applies local DST rules to the wall-clock deadline
+        await asyncio.sleep(max(0.0, time.mktime(next_time.timetuple()) - time.time()))
+        
+        for run_time, job in runs:
+            if run_time == next_time:
+                await loop.run_in_executor(None, job)
+        
+        # Never reschedule a job for the deadline it just ran at
+        now = max(datetime.datetime.now(), next_time)
+
 def schedule_auto_updates():
     """Schedule automatic updates"""
     
-    # Schedule daily updates at 2 AM
-    schedule.every().day.at("02:00").do(run_auto_update_check)
-    
-    # Schedule weekly comprehensive updates
-    schedule.every().sunday.at("03:00").do(run_comprehensive_update)
+    jobs = [
+        (run_auto_update_check, 2, None),  # Daily updates at 2 AM
+        (run_comprehensive_update, 3, 6)   # Weekly comprehensive updates, Sunday 3 AM
+    ]
     
     print("📅 Auto-updates scheduled:")
     print("   Daily check: 2:00 AM")
     print("   Weekly comprehensive: Sunday 3:00 AM")
     
-    while True:
-        schedule.run_pending()
-        time.sleep(3600)  # Check every hour
+    asyncio.run(_run_schedule(jobs))
 
 def run_comprehensive_update():
     """Run comprehensive weekly update"""
     
     print("🔄 Running comprehensive weekly update...")
     
-    # Run learning cycle
     from continuous_learning_agent import run_daily_learning_cycle
-    run_daily_learning_cycle()
-    
-    # Run performance monitoring
     from performance_monitoring import run_performance_monitoring
-    run_performance_monitoring()
     
-    # Run auto update
+    # Learning cycle and performance monitoring are I/O-bound and independent;
+    # learning_data/ access is serialized by learning_data_lock
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            executor.submit(run_daily_learning_cycle): "learning cycle",
+            executor.submit(run_performance_monitoring): "performance monitoring"
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"⚠️  {futures[future]} failed: {e}")
+    
+    # Run auto update (depends on the patterns just learned)
     run_auto_update_check()
     
     print("✅ Comprehensive update complete!")
@@ -4,13 +4,16 @@ Analyzes, detects, and fixes damaged GitHub Actions pipelines
 """
 import os
 import sys
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from itertools import chain
+from typing import Dict, Optional, Union
 from loguru import logger
 
-from modules.log_analyzer import LogAnalyzer
+from modules.log_analyzer import LogAnalyzer, BLOCKING_CATEGORIES
 from modules.yaml_validator import YAMLValidator
 from modules.error_fixer import ErrorFixer
-from modules.github_integration import GitHubIntegration
+from modules.github_integration import GitHubIntegration, MAX_CONCURRENT_DOWNLOADS
 from modules.reporter import Reporter
 
 
@@ -33,17 +36,26 @@ class CICDAgent:
         
         logger.info("CI/CD Agent initialized")
     
-    def analyze_failed_workflows(self, max_workflows: int = 5) -> None:
+    def analyze_failed_workflows(
+        self,
+        max_workflows: int = 5,
+        since: Optional[Union[date, str]] = None,
+        branch: Optional[str] = None
+    ) -> None:
         """
         Analyze failed workflows and generate reports
         
         Args:
             max_workflows: Maximum number of failed workflows to analyze
+            since: Only analyze runs created on or after this date
+            branch: Only analyze runs triggered on this branch
         """
         logger.info("Starting workflow analysis...")
         
-        # Fetch failed workflow runs
-        failed_runs = self.github.get_workflow_runs(status="failure", max_results=max_workflows)
+        # Fetch failed workflow runs, filtered by the API rather than locally
+        failed_runs = self.github.get_workflow_runs(
+            status="failure", max_results=max_workflows, since=since, branch=branch
+        )
         
         if not failed_runs:
             logger.info("No failed workflows found")
@@ -51,32 +63,51 @@ class CICDAgent:
         
         logger.info(f"Found {len(failed_runs)} failed workflow(s)")
         
-        # Analyze each failed workflow
-        for workflow_info in failed_runs:
-            logger.info(f"Analyzing workflow: {workflow_info['name']} (ID: {workflow_info['id']})")
-            
-            # Get workflow logs
-            logs = self.github.get_workflow_logs(workflow_info['id'])
+        # Log downloads dominate; fan them out and keep results in run order
+        workers = min(MAX_CONCURRENT_DOWNLOADS, len(failed_runs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self._analyze_workflow, failed_runs))
+    
+    def _analyze_workflow(self, workflow_info: Dict) -> Optional[str]:
+        """
+        Fetch, analyze and report on a single failed workflow run
+        
+        Args:
+            workflow_info: Run information from get_workflow_runs
             
-            if logs:
-                # Analyze logs
-                log_analysis = self.log_analyzer.analyze_log(logs)
-                
-                # Generate fix recommendations
-                fix_report = self.error_fixer.generate_fix_report(log_analysis)
-                
-                # Generate and display report
-                report = self.reporter.generate_analysis_report(
-                    workflow_info, log_analysis, fix_report
-                )
-                
-                logger.info(f"\n{report}")
-                
-                # Save report to file
-                report_filename = f"workflow_analysis_{workflow_info['id']}.md"
-                with open(report_filename, 'w') as f:
-                    f.write(report)
-                logger.info(f"Report saved to {report_filename}")
+        Returns:
+            Path of the saved report, or None if no logs were available
+        """
+        logger.info(f"Analyzing workflow: {workflow_info['name']} (ID: {workflow_info['id']})")
+        
+        # Stream workflow logs straight into the analyzer
+        log_lines = self.github.iter_log_lines(workflow_info['id'], workflow_info.get('logs_url'))
+        first_line = next(log_lines, None)
+        
+        if first_line is None:
+            return None
+        
+        # Analyze logs, stopping at the first error that explains the failure
+        log_analysis = self.log_analyzer.analyze_lines(
+            chain([first_line], log_lines), stop_categories=BLOCKING_CATEGORIES
+        )
+        
+        # Generate fix recommendations
+        fix_report = self.error_fixer.generate_fix_report(log_analysis)
+        
+        # Generate and display report
+        report = self.reporter.generate_analysis_report(
+            workflow_info, log_analysis, fix_report
+        )
+        
+        logger.info(f"\n{report}")
+        
+        # Save report to file
+        report_filename = f"workflow_analysis_{workflow_info['id']}.md"
+        with open(report_filename, 'w') as f:
+            f.write(report)
+        logger.info(f"Report saved to {report_filename}")
+        return report_filename
     
     def validate_workflow_yaml(self, yaml_file_path: str, apply_fixes: bool = False) -> Dict:
         """
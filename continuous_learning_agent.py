@@ -5,26 +5,205 @@ Analyzes daily production pipeline errors and automatically improves performance
 """
 
 import os
+import sys
+import atexit
 import json
 import yaml
 import re
+import string
 import datetime
-from typing import Dict, List, Tuple, Optional
+import hashlib
+import mmap
+import queue
+import threading
+from collections import Counter, OrderedDict, deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from enterprise_cicd_agent import EnterpriseGradeCICDAgent
 
-# Setup logging for continuous improvement tracking
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
+try:
+    import ahocorasick  # pyahocorasick, optional
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional, faster serializer
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Setup logging for continuous improvement tracking. Records are queued and written
+# by a listener thread, so logging in the processing loops never waits on file I/O.
+_log_queue = queue.SimpleQueue()
+_log_handler = QueueHandler(_log_queue)
+_log_handler.setFormatter(logging.Formatter('%(message)s'))  # Real formatting happens in the listener
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
+
+if _log_handler in logging.getLogger().handlers:
+    _log_outputs = (
         logging.FileHandler('agent_learning.log', encoding='utf-8'),
         logging.StreamHandler()
-    ]
+    )
+    for _output in _log_outputs:
+        _output.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _log_listener = QueueListener(_log_queue, *_log_outputs)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # Drains queued records before exit
+
+# "Replace '<broken>' with '<correct>'" fix suggestions
+_REPLACE_SUGGESTION_RE = re.compile(r"Replace '(?P<broken>.*?)' with '(?P<correct>.*?)'\Z", re.DOTALL)
+
+# Categories whose learned fixes are plain text replacements
+_REPLACEABLE_CATEGORIES = frozenset({"runner_specification", "action_version"})
+
+# Body of the generated auto_learned_patterns module, after its PATTERN_FIXES table:
+# the shared single-pass matcher from modules.auto_learned_fixes over every broken token
+_LEARNED_FIXES_CODE = """
+_MESSAGES = {broken: message for broken, _, message in PATTERN_FIXES}
+_replace = build_replacer({broken: correct for broken, correct, _ in PATTERN_FIXES})
+
+
+def apply_learned_fixes(content, fixes_applied=None):
+    \"\"\"Replace every learned broken token in one pass, logging each fix once\"\"\"
+    if fixes_applied is None:
+        return _replace(content)
+    return _replace(content, lambda broken: fixes_applied.append(_MESSAGES[broken]))
+"""
+
+def _line_count(text: str) -> int:
+    """Number of lines in text, like len(text.splitlines()) for '\n' line endings, without the list"""
+    if not text:
+        return 0
+    return text.count('\n') + (0 if text.endswith('\n') else 1)
+
+# Every boundary str.splitlines() recognises
+_LINE_BREAK_RE = re.compile(r'[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+# Common fix patterns for unresolved errors, broken fragment -> replacement
+_COMMON_FIXES = {
+    'ubuntu-lat': 'ubuntu-latest',
+    'actions/checkout@': 'actions/checkout@v4',
+    'actions/setup-node@': 'actions/setup-node@v4',
+    'actions/setup-python@': 'actions/setup-python@v4',
+    'NODE_VERSIO': 'NODE_VERSION',
+    'PYTHON_VERSIO': 'PYTHON_VERSION',
+    'REGISTR': 'REGISTRY',
+    'IMAGE_NAM': 'IMAGE_NAME',
+    'TERRAFORM_VERSIO': 'TERRAFORM_VERSION',
+    'KUBECTL_VERSIO': 'KUBECTL_VERSION',
+    'HELM_VERSIO': 'HELM_VERSION'
+}
+
+# One automaton over the broken fragments; values carry table order so the first
+# table entry found in an error wins, as with a scan of the table
+if ahocorasick is not None:
+    _COMMON_FIXES_AUTOMATON = ahocorasick.Automaton()
+    for _index, (_broken, _correct) in enumerate(_COMMON_FIXES.items()):
+        _COMMON_FIXES_AUTOMATON.add_word(_broken, (_index, _broken, _correct))
+    _COMMON_FIXES_AUTOMATON.make_automaton()
+else:
+    _COMMON_FIXES_AUTOMATON = None
+
+def _common_fix_for(error: str) -> Optional[Tuple[str, str]]:
+    """(broken, correct) for the first _COMMON_FIXES entry found in error, if any"""
+    if _COMMON_FIXES_AUTOMATON is None:
+        for broken, correct in _COMMON_FIXES.items():
+            if broken in error:
+                return broken, correct
+        return None
+    found = min((value for _, value in _COMMON_FIXES_AUTOMATON.iter(error)), default=None)
+    return found[1:] if found is not None else None
+
+# Broken fragments that should no longer appear once a pipeline has been fixed
+_KNOWN_ERRORS = (
+    'ubuntu-lat', 'actions/checkout@', 'gitleaks/gitleaks-action@v',
+    'aquasecurity/trivy-action@', 'dependency-check/Dependency-Check_Action@',
+    'actions/setup-node@', 'actions/setup-python@', 'NODE_VERSIO',
+    'PYTHON_VERSIO', 'REGISTR', 'IMAGE_NAM', 'TERRAFORM_VERSIO',
+    'KUBECTL_VERSIO', 'HELM_VERSIO', 'requirement.txt', 'requir.txt',
+    'PYTHONPTH', 'matrix.analysis =', 'needs.security-gate.outputs.security-passed =',
+    'github.ref =', 'github.event_name =', 'timeout:', 'actions/cache@',
+    'actions/setup-java@', 'docker/setup-buildx-action@', 'docker/login-action@',
+    'docker/build-push-action@', 'hashicorp/setup-terraform@',
+    'anchore/sbom-action@', 'actions/upload-artifact@', 'permissions: write-all'
 )
 
+# One automaton finds every known error in a single pass; values are list positions
+if ahocorasick is not None:
+    _KNOWN_ERRORS_AUTOMATON = ahocorasick.Automaton()
+    for _index, _error in enumerate(_KNOWN_ERRORS):
+        _KNOWN_ERRORS_AUTOMATON.add_word(_error, _index)
+    _KNOWN_ERRORS_AUTOMATON.make_automaton()
+else:
+    _KNOWN_ERRORS_AUTOMATON = None
+
+def _known_errors_in(content: str) -> List[str]:
+    """Known errors present in content, in _KNOWN_ERRORS order"""
+    if _KNOWN_ERRORS_AUTOMATON is None:
+        return [error for error in _KNOWN_ERRORS if error in content]
+    found = {index for _, index in _KNOWN_ERRORS_AUTOMATON.iter(content)}
+    return [_KNOWN_ERRORS[index] for index in sorted(found)]
+
+def _json_dumps(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON; dataclasses are encoded directly, without asdict()"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, default=asdict).encode('utf-8')
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Parse outcome per content digest: None when the YAML loads, else the error text.
+# Keyed on the digest so cached entries don't keep whole pipelines alive.
+_YAML_ERROR_CACHE_SIZE = 4096
+_yaml_error_cache: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+_yaml_error_cache_lock = threading.Lock()
+
+def _yaml_error(content: str) -> Optional[str]:
+    """YAML parse error for content, or None; repeated content is not reparsed"""
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+    with _yaml_error_cache_lock:
+        if digest in _yaml_error_cache:
+            _yaml_error_cache.move_to_end(digest)
+            return _yaml_error_cache[digest]
+    
+    try:
+        yaml.load(content, Loader=_YamlLoader)
+        error = None
+    except yaml.YAMLError as e:
+        error = str(e)
+    
+    with _yaml_error_cache_lock:
+        _yaml_error_cache[digest] = error
+        if len(_yaml_error_cache) > _YAML_ERROR_CACHE_SIZE:
+            _yaml_error_cache.popitem(last=False)
+    return error
+
+# Pipelines read and fixed ahead of the learning loop
+_MAX_PIPELINES_IN_FLIGHT = 20
+
+# Daily entries kept in performance_history.json, about a year's worth
+_PERFORMANCE_HISTORY_DAYS = 365
+
+# Pattern keys keep [a-z0-9-_] and map every other character to '_'.
+# ASCII errors go through one translate pass, the rest through the regex.
+_KEY_TABLE = str.maketrans({
+    chr(i): chr(i) if chr(i) in string.ascii_lowercase + string.digits + '-_' else '_'
+    for i in range(128)
+})
+_NON_KEY_CHARS = re.compile(r'[^a-zA-Z0-9\-_]')
+
+# Serializes learning_data/ JSON access when learning runs alongside other jobs
+learning_data_lock = threading.Lock()
+
 @dataclass
 class ErrorPattern:
     error_text: str
@@ -48,45 +227,124 @@ class LearningReport:
 class ContinuousLearningAgent:
     """Agent that learns from daily errors and improves automatically"""
     
+    # Keywords per category, in priority order: the first category with any keyword wins
+    _CATEGORY_KEYWORDS = (
+        ("runner_specification", ('ubuntu', 'windows', 'macos', 'runner')),
+        ("action_version", ('action', '@v', 'checkout', 'setup')),
+        ("environment_variable", ('env', 'version', 'variable')),
+        ("yaml_structure", ('yaml', 'syntax', 'mapping', 'indent')),
+        ("configuration", ('timeout', 'permission', 'security')),
+    )
+    
+    # Alternatives are tried in order at position 0, so priority holds even when a
+    # lower-priority keyword occurs earlier in the text; lastgroup names the category
+    _CATEGORY_RE = re.compile('|'.join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, words))}))(?P<{category}>)"
+        for category, words in _CATEGORY_KEYWORDS
+    ), re.IGNORECASE | re.DOTALL)
+    
     def __init__(self, learning_data_path: str = "learning_data"):
         self.learning_data_path = Path(learning_data_path)
         self.learning_data_path.mkdir(exist_ok=True)
         
+        # Snapshot of all patterns, plus an append-only log of updates made since it was written
         self.patterns_file = self.learning_data_path / "learned_patterns.json"
+        self.patterns_log_file = self.learning_data_path / "learned_patterns.jsonl"
+        self._patterns_log_lines = 0
+        self._dirty_patterns = set()
         self.performance_file = self.learning_data_path / "performance_history.json"
         self.daily_errors_file = self.learning_data_path / "daily_errors.json"
+        self.seen_pipelines_file = self.learning_data_path / "seen_hashes.json"
         
         self.learned_patterns = self._load_learned_patterns()
         self.performance_history = self._load_performance_history()
+        self._seen_fingerprint, self.seen_pipelines = self._load_seen_pipelines()
         self.agent = EnterpriseGradeCICDAgent()
         
         logging.info("🧠 Continuous Learning Agent initialized")
     
     def _load_learned_patterns(self) -> Dict[str, ErrorPattern]:
-        """Load previously learned error patterns"""
-        if self.patterns_file.exists():
-            with open(self.patterns_file, 'r') as f:
-                data = json.load(f)
-                return {k: ErrorPattern(**v) for k, v in data.items()}
-        return {}
+        """Load previously learned error patterns: the snapshot, then the update log replayed over it"""
+        data = {}
+        with learning_data_lock:
+            if self.patterns_file.exists():
+                with open(self.patterns_file, 'rb') as f:
+                    data = _json_loads(f.read())
+            
+            if self.patterns_log_file.exists():
+                with open(self.patterns_log_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            data.update(_json_loads(line))
+                        except ValueError:
+                            break  # Torn final line from an interrupted append
+                        self._patterns_log_lines += 1
+        
+        return {k: ErrorPattern(**v) for k, v in data.items()}
     
     def _save_learned_patterns(self):
-        """Save learned patterns to file"""
-        data = {k: asdict(v) for k, v in self.learned_patterns.items()}
-        with open(self.patterns_file, 'w') as f:
-            json.dump(data, f, indent=2)
-    
-    def _load_performance_history(self) -> List[Dict]:
-        """Load performance history"""
-        if self.performance_file.exists():
-            with open(self.performance_file, 'r') as f:
-                return json.load(f)
-        return []
+        """Append patterns changed since the last save to the update log"""
+        if self._dirty_patterns:
+            lines = b''.join(
+                _json_dumps({k: self.learned_patterns[k]}) + b'\n'
+                for k in self._dirty_patterns
+            )
+            with learning_data_lock, open(self.patterns_log_file, 'ab') as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self._patterns_log_lines += len(self._dirty_patterns)
+            self._dirty_patterns.clear()
+        
+        self._compact_if_needed()
+    
+    def _compact_if_needed(self):
+        """Fold the update log into a fresh snapshot once it outgrows the pattern set"""
+        if self.patterns_file.exists() and self._patterns_log_lines <= 4 * len(self.learned_patterns):
+            return
+        
+        data = _json_dumps(self.learned_patterns, indent=True)
+        tmp_file = self.patterns_file.with_suffix('.json.tmp')
+        with learning_data_lock:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.patterns_file)
+            # Snapshot is durable before the log goes; replaying a stale log would be harmless anyway
+            if self.patterns_log_file.exists():
+                self.patterns_log_file.unlink()
+        self._patterns_log_lines = 0
+    
+    def _load_performance_history(self) -> Deque[Dict]:
+        """Load performance history, keeping only the most recent days"""
+        history = []
+        with learning_data_lock:
+            if self.performance_file.exists():
+                with open(self.performance_file, 'rb') as f:
+                    history = _json_loads(f.read())
+        return deque(history, maxlen=_PERFORMANCE_HISTORY_DAYS)
     
     def _save_performance_history(self):
         """Save performance history"""
-        with open(self.performance_file, 'w') as f:
-            json.dump(self.performance_history, f, indent=2)
+        data = _json_dumps(list(self.performance_history), indent=True)
+        with learning_data_lock, open(self.performance_file, 'wb') as f:
+            f.write(data)
+    
+    def _load_seen_pipelines(self) -> Tuple[Dict, Dict[str, Dict]]:
+        """Load the agent fingerprint and per-pipeline results recorded by the last run"""
+        with learning_data_lock:
+            if self.seen_pipelines_file.exists():
+                with open(self.seen_pipelines_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                    return data['agent'], data['pipelines']
+        return {}, {}
+    
+    def _save_seen_pipelines(self):
+        """Save per-pipeline results for the next run"""
+        data = _json_dumps({'agent': self._seen_fingerprint, 'pipelines': self.seen_pipelines})
+        with learning_data_lock, open(self.seen_pipelines_file, 'wb') as f:
+            f.write(data)
     
     def analyze_pipeline_error(self, original_content: str, fixed_content: str, 
                               remaining_errors: List[str], file_path: str = "") -> Dict:
@@ -95,8 +353,8 @@ class ContinuousLearningAgent:
         analysis = {
             'timestamp': datetime.datetime.now().isoformat(),
             'file_path': file_path,
-            'original_lines': len(original_content.splitlines()),
-            'fixed_lines': len(fixed_content.splitlines()),
+            'original_lines': _line_count(original_content),
+            'fixed_lines': _line_count(fixed_content),
             'remaining_errors': remaining_errors,
             'new_patterns_discovered': []
         }
@@ -109,11 +367,13 @@ class ContinuousLearningAgent:
                 # Update existing pattern
                 self.learned_patterns[pattern_key].frequency += 1
                 self.learned_patterns[pattern_key].last_seen = datetime.datetime.now().isoformat()
+                self._dirty_patterns.add(pattern_key)
             else:
                 # Discover new pattern
                 new_pattern = self._extract_error_pattern(error, original_content, fixed_content)
                 if new_pattern:
                     self.learned_patterns[pattern_key] = new_pattern
+                    self._dirty_patterns.add(pattern_key)
                     analysis['new_patterns_discovered'].append(pattern_key)
                     logging.info(f"🔍 New error pattern discovered: {pattern_key}")
         
@@ -121,9 +381,11 @@ class ContinuousLearningAgent:
     
     def _generate_pattern_key(self, error: str) -> str:
         """Generate unique key for error pattern"""
-        # Create a normalized pattern key
-        normalized = re.sub(r'[^a-zA-Z0-9\-_]', '_', error.lower())
-        return normalized[:50]  # Limit length
+        # Create a normalized pattern key, limited to 50 characters
+        if error.isascii():
+            # lower() keeps ASCII lengths, so truncating first is safe
+            return error[:50].lower().translate(_KEY_TABLE)
+        return _NON_KEY_CHARS.sub('_', error.lower())[:50]
     
     def _extract_error_pattern(self, error: str, original: str, fixed: str) -> Optional[ErrorPattern]:
         """Extract and categorize error pattern from failed fix"""
@@ -148,50 +410,20 @@ class ContinuousLearningAgent:
     
     def _categorize_error(self, error: str) -> str:
         """Categorize error type"""
-        error_lower = error.lower()
-        
-        if any(word in error_lower for word in ['ubuntu', 'windows', 'macos', 'runner']):
-            return "runner_specification"
-        elif any(word in error_lower for word in ['action', '@v', 'checkout', 'setup']):
-            return "action_version"
-        elif any(word in error_lower for word in ['env', 'version', 'variable']):
-            return "environment_variable"
-        elif any(word in error_lower for word in ['yaml', 'syntax', 'mapping', 'indent']):
-            return "yaml_structure"
-        elif any(word in error_lower for word in ['timeout', 'permission', 'security']):
-            return "configuration"
-        else:
-            return "unknown"
+        match = self._CATEGORY_RE.match(error)
+        return match.lastgroup if match else "unknown"
     
     def _suggest_fix_for_error(self, error: str, original: str, fixed: str) -> Optional[str]:
         """Analyze context to suggest fix for unresolved error"""
         
-        # Look for similar patterns in original vs fixed content
-        error_lines = [line for line in original.splitlines() if error in line]
-        
-        if not error_lines:
+        # The error must appear within a single line of the original; text without
+        # line breaks does so exactly when it occurs anywhere in the original
+        if _LINE_BREAK_RE.search(error) or error not in original:
             return None
         
-        error_line = error_lines[0].strip()
-        
-        # Common fix patterns
-        fixes = {
-            'ubuntu-lat': 'ubuntu-latest',
-            'actions/checkout@': 'actions/checkout@v4', 
-            'actions/setup-node@': 'actions/setup-node@v4',
-            'actions/setup-python@': 'actions/setup-python@v4',
-            'NODE_VERSIO': 'NODE_VERSION',
-            'PYTHON_VERSIO': 'PYTHON_VERSION',
-            'REGISTR': 'REGISTRY',
-            'IMAGE_NAM': 'IMAGE_NAME',
-            'TERRAFORM_VERSIO': 'TERRAFORM_VERSION',
-            'KUBECTL_VERSIO': 'KUBECTL_VERSION',
-            'HELM_VERSIO': 'HELM_VERSION'
-        }
-        
-        for broken, correct in fixes.items():
-            if broken in error:
-                return f"Replace '{broken}' with '{correct}'"
+        fix = _common_fix_for(error)
+        if fix is not None:
+            return "Replace '{}' with '{}'".format(*fix)
         
         return f"Manual review required for: {error}"
     
@@ -206,34 +438,103 @@ class ContinuousLearningAgent:
         improved_patterns = 0
         total_success_rate = 0
         
-        for pipeline_file in pipeline_dir.glob("*.yml"):
-            if pipeline_file.name.startswith("broken_") or "test" in pipeline_file.name:
+        # Filter on the names scandir already has; only survivors become Path objects
+        with os.scandir(pipeline_dir) as entries:
+            pipeline_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".yml")
+                and not entry.name.startswith("broken_")
+                and "test" not in entry.name
+                and entry.is_file()
+            ]
+        
+        # Pipelines unchanged since the last run, fixed by an unchanged agent, keep their
+        # previous result and are neither fixed nor learned from again
+        fingerprint = _agent_fingerprint()
+        seen = self.seen_pipelines if self._seen_fingerprint == fingerprint else {}
+        stamps = {f: _file_stamp(f) for f in pipeline_files}
+        reused = {}
+        for f in pipeline_files:
+            entry = seen.get(str(f))
+            if entry is None or stamps[f] is None:
                 continue
+            if (entry['mtime_ns'], entry['size']) != stamps[f]:
+                # Touched since; only content changes count
+                try:
+                    if _content_digest(_read_text(str(f))) != entry['hash']:
+                        continue
+                except (OSError, ValueError):
+                    continue
+                entry = dict(entry, mtime_ns=stamps[f][0], size=stamps[f][1])
+            reused[f] = entry
+        stale = [f for f in pipeline_files if f not in reused]
+        
+        # Reading and fixing run in worker processes when there is more than one core,
+        # learning stays serial in this process and log writes go to the listener thread.
+        # At most _MAX_PIPELINES_IN_FLIGHT results are pending, which bounds memory; stale
+        # files are submitted in the order they are consumed below.
+        workers = min(os.cpu_count() or 1, len(stale))
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        futures = {}
+        pending_files = iter(stale)
+        
+        def submit_next():
+            pipeline_file = next(pending_files, None)
+            if pipeline_file is not None:
+                futures[pipeline_file] = executor.submit(_process_one_pipeline, str(pipeline_file))
+        
+        if executor is not None:
+            for _ in range(_MAX_PIPELINES_IN_FLIGHT):
+                submit_next()
+        
+        seen_pipelines = {}
+        try:
+            for pipeline_file in pipeline_files:
+                entry = reused.get(pipeline_file)
+                if entry is not None:
+                    seen_pipelines[str(pipeline_file)] = entry
+                    pipelines_processed += 1
+                    total_success_rate += entry['success_rate']
+                    logging.info(f"♻️  Unchanged {pipeline_file.name}: {entry['success_rate']:.1f}% success rate")
+                    continue
                 
-            try:
-                with open(pipeline_file, 'r') as f:
-                    content = f.read()
-                
-                # Test current agent performance
-                fixed_content = self.agent.fix_production_pipeline(content)
-                
-                # Validate results
-                remaining_errors = self._find_remaining_errors(content, fixed_content)
-                success_rate = self._calculate_success_rate(content, remaining_errors)
-                
-                # Analyze and learn
-                analysis = self.analyze_pipeline_error(
-                    content, fixed_content, remaining_errors, str(pipeline_file)
-                )
-                
-                pipelines_processed += 1
-                new_patterns += len(analysis['new_patterns_discovered'])
-                total_success_rate += success_rate
-                
-                logging.info(f"📊 Processed {pipeline_file.name}: {success_rate:.1f}% success rate")
-                
-            except Exception as e:
-                logging.error(f"❌ Error processing {pipeline_file}: {e}")
+                try:
+                    # Test current agent performance and validate results
+                    if pipeline_file in futures:
+                        future = futures.pop(pipeline_file)
+                        submit_next()
+                        outcome = future.result()
+                    else:
+                        outcome = _process_one_pipeline(str(pipeline_file), self.agent)
+                    content, fixed_content, remaining_errors, success_rate = outcome
+                    
+                    # Analyze and learn
+                    analysis = self.analyze_pipeline_error(
+                        content, fixed_content, remaining_errors, str(pipeline_file)
+                    )
+                    
+                    pipelines_processed += 1
+                    new_patterns += len(analysis['new_patterns_discovered'])
+                    total_success_rate += success_rate
+                    
+                    if stamps[pipeline_file] is not None:
+                        seen_pipelines[str(pipeline_file)] = {
+                            'mtime_ns': stamps[pipeline_file][0],
+                            'size': stamps[pipeline_file][1],
+                            'hash': _content_digest(content),
+                            'success_rate': success_rate
+                        }
+                    
+                    logging.info(f"📊 Processed {pipeline_file.name}: {success_rate:.1f}% success rate")
+                    
+                except Exception as e:
+                    logging.error(f"❌ Error processing {pipeline_file}: {e}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        self._seen_fingerprint = fingerprint
+        self.seen_pipelines = seen_pipelines
         
         # Calculate improvements
         avg_success_rate = total_success_rate / pipelines_processed if pipelines_processed > 0 else 0
@@ -252,6 +553,7 @@ class ContinuousLearningAgent:
         # Save learned data
         self._save_learned_patterns()
         self._save_performance_history()
+        self._save_seen_pipelines()
         
         return LearningReport(
             date=today,
@@ -262,36 +564,21 @@ class ContinuousLearningAgent:
             top_error_categories=self._get_top_error_categories()
         )
     
-    def _find_remaining_errors(self, original: str, fixed: str) -> List[str]:
+    @staticmethod
+    def _find_remaining_errors(original: str, fixed: str) -> List[str]:
         """Find errors that weren't fixed"""
         
-        known_errors = [
-            'ubuntu-lat', 'actions/checkout@', 'gitleaks/gitleaks-action@v',
-            'aquasecurity/trivy-action@', 'dependency-check/Dependency-Check_Action@',
-            'actions/setup-node@', 'actions/setup-python@', 'NODE_VERSIO', 
-            'PYTHON_VERSIO', 'REGISTR', 'IMAGE_NAM', 'TERRAFORM_VERSIO',
-            'KUBECTL_VERSIO', 'HELM_VERSIO', 'requirement.txt', 'requir.txt',
-            'PYTHONPTH', 'matrix.analysis =', 'needs.security-gate.outputs.security-passed =',
-            'github.ref =', 'github.event_name =', 'timeout:', 'actions/cache@',
-            'actions/setup-java@', 'docker/setup-buildx-action@', 'docker/login-action@',
-            'docker/build-push-action@', 'hashicorp/setup-terraform@', 
-            'anchore/sbom-action@', 'actions/upload-artifact@', 'permissions: write-all'
-        ]
-        
-        remaining = []
-        for error in known_errors:
-            if error in fixed:
-                remaining.append(error)
+        remaining = _known_errors_in(fixed)
         
         # Check for YAML syntax errors
-        try:
-            yaml.safe_load(fixed)
-        except yaml.YAMLError as e:
-            remaining.append(f"YAML_SYNTAX_ERROR: {str(e)}")
+        yaml_error = _yaml_error(fixed)
+        if yaml_error is not None:
+            remaining.append(f"YAML_SYNTAX_ERROR: {yaml_error}")
         
         return remaining
     
-    def _calculate_success_rate(self, original: str, remaining_errors: List[str]) -> float:
+    @staticmethod
+    def _calculate_success_rate(original: str, remaining_errors: List[str]) -> float:
         """Calculate success rate based on remaining errors"""
         total_known_issues = 26  # Based on our test pipeline
         fixed_issues = total_known_issues - len(remaining_errors)
@@ -299,46 +586,44 @@ class ContinuousLearningAgent:
     
     def _get_top_error_categories(self) -> List[str]:
         """Get most frequent error categories"""
-        categories = {}
+        categories = Counter()
         for pattern in self.learned_patterns.values():
-            categories[pattern.category] = categories.get(pattern.category, 0) + pattern.frequency
+            categories[pattern.category] += pattern.frequency
         
-        return sorted(categories.keys(), key=lambda x: categories[x], reverse=True)[:5]
+        return [category for category, _ in categories.most_common(5)]
     
     def generate_enhancement_code(self) -> str:
         """Generate code to enhance the agent based on learned patterns"""
+        return ''.join(self._iter_enhancement_code())
+    
+    def _iter_enhancement_code(self) -> Iterator[str]:
+        """Yield the learned-fix table for patterns seen multiple times, then the code applying it"""
+        todo = []
+        yield ("from modules.auto_learned_fixes import build_replacer\n\n"
+               "# (broken, correct, message) for every learned replacement\nPATTERN_FIXES = [\n")
+        for pattern in self.learned_patterns.values():
+            if pattern.frequency < 3:
+                continue
+            fix = self._generate_fix_code(pattern)
+            if fix is None:
+                todo.append(f"# TODO: Implement fix for {pattern.category}: {pattern.error_text}\n")
+            else:
+                yield f"    {fix!r},\n"
+        yield "]\n\n"
+        yield from todo
+        yield _LEARNED_FIXES_CODE
+    
+    def _generate_fix_code(self, pattern: ErrorPattern) -> Optional[Tuple[str, str, str]]:
+        """PATTERN_FIXES row (broken, correct, message) for this pattern, None if it needs manual work"""
+        if pattern.category not in _REPLACEABLE_CATEGORIES:
+            return None
         
-        enhancements = []
+        match = _REPLACE_SUGGESTION_RE.match(pattern.fix_suggestion)
+        if match is None:
+            return None
         
-        for pattern in self.learned_patterns.values():
-            if pattern.frequency >= 3:  # Pattern seen multiple times
-                fix_code = self._generate_fix_code(pattern)
-                enhancements.append(fix_code)
-        
-        return '\n\n'.join(enhancements)
-    
-    def _generate_fix_code(self, pattern: ErrorPattern) -> str:
-        """Generate Python code to fix this pattern"""
-        
-        if pattern.category == "runner_specification":
-            return f"""
-    def _fix_runner_{pattern.error_text.replace('-', '_')}(self, content: str) -> str:
-        \"\"\"Auto-generated fix for {pattern.error_text}\"\"\"
-        if '{pattern.error_text}' in content:
-            content = content.replace('{pattern.error_text}', '{pattern.fix_suggestion.split("'")[3]}')
-            self.fixes_applied.append("Auto-learned: {pattern.error_text} → {pattern.fix_suggestion.split("'")[3]}")
-        return content"""
-        
-        elif pattern.category == "action_version":
-            return f"""
-    def _fix_action_{pattern.error_text.replace('/', '_').replace('@', '_')}(self, content: str) -> str:
-        \"\"\"Auto-generated fix for {pattern.error_text}\"\"\"
-        if '{pattern.error_text}' in content:
-            content = content.replace('{pattern.error_text}', '{pattern.fix_suggestion.split("'")[3]}')
-            self.fixes_applied.append("Auto-learned: {pattern.error_text} → {pattern.fix_suggestion.split("'")[3]}")
-        return content"""
-        
-        return f"# TODO: Implement fix for {pattern.category}: {pattern.error_text}"
+        broken, correct = match.group('broken', 'correct')
+        return broken, correct, f"Auto-learned: {broken} → {correct}"
     
     def update_agent_patterns(self) -> bool:
         """Update the main agent with new learned patterns"""
@@ -347,19 +632,25 @@ class ContinuousLearningAgent:
             return False
         
         try:
-            # Generate enhancement code
-            new_code = self.generate_enhancement_code()
-            
-            # Save as enhancement module
-            with open('modules/auto_learned_patterns.py', 'w') as f:
-                f.write(f'''"""
+            # Stream enhancement code into a temp file instead of joining it in memory;
+            # it only replaces the module once every pattern has been rendered
+            module_file = Path('modules/auto_learned_patterns.py')
+            tmp_file = module_file.with_suffix('.py.tmp')
+            try:
+                with open(tmp_file, 'w') as f:
+                    f.write(f'''"""
 Auto-generated pattern fixes based on continuous learning
 Generated on: {datetime.datetime.now().isoformat()}
 Total patterns learned: {len(self.learned_patterns)}
 """
 
-{new_code}
 ''')
+                    for chunk in self._iter_enhancement_code():
+                        f.write(chunk)
+                os.replace(tmp_file, module_file)
+            finally:
+                if tmp_file.exists():
+                    tmp_file.unlink()
             
             logging.info(f"🚀 Generated {len(self.learned_patterns)} new pattern fixes")
             return True
@@ -405,9 +696,10 @@ Total patterns learned: {len(self.learned_patterns)}
         if not self.performance_history:
             return "No historical data available"
         
-        history = self.performance_history[-5:]  # Last 5 days
+        # Last 5 days, oldest first, without copying the whole history
+        history = list(islice(reversed(self.performance_history), 5))
         lines = []
-        for entry in history:
+        for entry in reversed(history):
             lines.append(f"- {entry['date']}: {entry['avg_success_rate']:.1f}% ({entry['pipelines_processed']} pipelines)")
         
         return '\n'.join(lines)
@@ -437,6 +729,57 @@ Total patterns learned: {len(self.learned_patterns)}
         return '\n'.join(recommendations) if recommendations else "No specific recommendations at this time"
 
 
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _content_digest(content: str) -> str:
+    """Hex digest identifying pipeline content"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+def _agent_fingerprint() -> Dict[str, List[int]]:
+    """Stamps of the sources that decide how pipelines get fixed, including learned fixes"""
+    agent_file = Path(sys.modules[EnterpriseGradeCICDAgent.__module__].__file__).resolve()
+    modules_dir = agent_file.parent / "modules"
+    # The agent plus the learned-fix table it loads once AgentAutoUpdater has integrated it.
+    # The generated auto_learned_patterns.py is rewritten every cycle but never imported.
+    sources = [agent_file, modules_dir / "auto_learned_fixes.py", modules_dir / "auto_learned_patterns.json"]
+    return {str(path): list(_file_stamp(path) or ()) for path in sources}
+
+def _read_text(path: str) -> str:
+    """Read a UTF-8 file with universal newlines, decoding straight from a read-only mapping"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''  # Empty files can't be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+# Per-process agent for _process_one_pipeline, created on first use in each worker
+_worker_agent = None
+
+def _process_one_pipeline(path: str, agent: Optional[EnterpriseGradeCICDAgent] = None
+                          ) -> Tuple[str, str, List[str], float]:
+    """Fix one pipeline file and check what is left; runs in a worker process"""
+    global _worker_agent
+    if agent is None:
+        if _worker_agent is None:
+            _worker_agent = EnterpriseGradeCICDAgent()
+        agent = _worker_agent
+    
+    content = _read_text(path)
+    fixed_content = agent.fix_production_pipeline(content)
+    remaining_errors = ContinuousLearningAgent._find_remaining_errors(content, fixed_content)
+    success_rate = ContinuousLearningAgent._calculate_success_rate(content, remaining_errors)
+    return content, fixed_content, remaining_errors, success_rate
+
+
 def run_daily_learning_cycle(pipeline_directory: str = "."):
     """Run the daily learning and improvement cycle"""
     
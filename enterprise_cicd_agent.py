@@ -4,13 +4,148 @@ Production-Grade CI/CD Agent - Enterprise Ready
 Handles complex multi-job workflows, matrix builds, deployments, and enterprise features
 """
 
-import yaml
 import re
+import warnings
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+try:
+    import ahocorasick  # pyahocorasick, optional
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # python-hyperscan, optional
+except ImportError:
+    hyperscan = None
+
+
+def _typo_pattern(typos) -> re.Pattern:
+    """Alternation of the typos, longest first, that skips text which is already correct
+
+    The trailing lookahead keeps e.g. 'ubuntu-lat' from matching inside 'ubuntu-latest',
+    so every table is idempotent and never grows 'ubuntu-latestest'.
+    """
+    alternation = '|'.join(re.escape(typo) for typo in sorted(typos, key=len, reverse=True))
+    return re.compile(f'(?:{alternation})(?![\\w.-])')
+
+
+def _typo_database(typos):
+    """Hyperscan database reporting every typo with its start offset, or None without Hyperscan"""
+    if hyperscan is None:
+        return None
+    # Hyperscan has no lookahead, so the boundary character is consumed as part of the match
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(typo).encode() + rb'(?:[^\w.\-]|$)' for typo in typos],
+        ids=list(range(len(typos))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(typos),
+    )
+    return db
+
+
+def _fix_messages(table: Dict[str, str], message) -> Dict[str, str]:
+    """Format the fixes_applied entry for every typo once, when the class is built"""
+    return {typo: message(typo, correct) for typo, correct in table.items()}
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader():
+    """libyaml's CSafeLoader when available, resolved (and warned about) on first use only"""
+    try:
+        from yaml import CSafeLoader as YamlLoader  # libyaml bindings
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+        warnings.warn("PyYAML was built without libyaml; pipeline validation falls back "
+                      "to the pure-Python parser", RuntimeWarning)
+    return YamlLoader
+
+
+def _has_matrix(job) -> bool:
+    """True when a job defines strategy.matrix, without rendering the job to a string"""
+    strategy = job.get('strategy') if isinstance(job, dict) else None
+    return isinstance(strategy, dict) and 'matrix' in strategy
+
+
 class EnterpriseGradeCICDAgent:
     """Enterprise-grade CI/CD agent that handles the most complex production pipelines"""
     
+    # Common runner typos with precise matching to avoid cascading fixes
+    _RUNNER_FIXES = {
+        'runs-on: ubuntu-lat': 'runs-on: ubuntu-latest',
+        'runs-on: ubuntu-20': 'runs-on: ubuntu-20.04',
+        'runs-on: ubuntu-22': 'runs-on: ubuntu-22.04',
+        'runs-on: windows-lates': 'runs-on: windows-latest',
+        'runs-on: macos-lates': 'runs-on: macos-latest',
+        'os: [ubuntu-lat': 'os: [ubuntu-latest',
+        '- ubuntu-lat': '- ubuntu-latest',
+        '- windows-lates': '- windows-latest',
+        '- macos-lates': '- macos-latest'
+    }
+    _RUNNER_MESSAGES = _fix_messages(_RUNNER_FIXES, lambda incorrect, correct: (
+        f"Runner: {incorrect.split(': ')[-1] if ': ' in incorrect else incorrect} -> {correct.split(': ')[-1] if ': ' in correct else correct}"
+    ))
+    
+    # Incomplete action versions
+    _ACTION_FIXES = {
+        'uses: actions/checkout@': 'uses: actions/checkout@v4',
+        'uses: actions/setup-node@': 'uses: actions/setup-node@v4',
+        'uses: actions/setup-python@': 'uses: actions/setup-python@v5',
+        'uses: actions/cache@': 'uses: actions/cache@v4',
+        'uses: actions/upload-artifact@': 'uses: actions/upload-artifact@v4',
+        'uses: docker/setup-buildx-action@': 'uses: docker/setup-buildx-action@v3',
+        'uses: docker/login-action@': 'uses: docker/login-action@v3',
+        'uses: docker/build-push-action@': 'uses: docker/build-push-action@v5',
+        'uses: hashicorp/setup-terraform@': 'uses: hashicorp/setup-terraform@v3',
+        'uses: aquasecurity/trivy-action@': 'uses: aquasecurity/trivy-action@master',
+        'uses: gitleaks/gitleaks-action@v': 'uses: gitleaks/gitleaks-action@v2',
+        'uses: anchore/sbom-action@': 'uses: anchore/sbom-action@v0',
+        'uses: github/codeql-action/upload-sarif@': 'uses: github/codeql-action/upload-sarif@v3',
+        'uses: codecov/codecov-action@': 'uses: codecov/codecov-action@v4',
+        'uses: 8398a7/action-slack@': 'uses: 8398a7/action-slack@v3'
+    }
+    _ACTION_MESSAGES = _fix_messages(_ACTION_FIXES, lambda incomplete, complete: (
+        f"Action: {incomplete.replace('uses: ', '').replace('@', '').replace('@v', '')}@ -> {complete.split('@')[1]}"
+    ))
+    
+    # Environment variable name typos
+    _ENV_FIXES = {
+        'NODE_VERSIO': 'NODE_VERSION',
+        'PYTHON_VERSIO': 'PYTHON_VERSION',
+        'REGISTR': 'REGISTRY',
+        'IMAGE_NAM': 'IMAGE_NAME',
+        'TERRAFORM_VERSIO': 'TERRAFORM_VERSION',
+        'KUBECTL_VERSIO': 'KUBECTL_VERSION',
+        'HELM_VERSIO': 'HELM_VERSION',
+        'PYTHONPTH': 'PYTHONPATH'
+    }
+    _ENV_MESSAGES = _fix_messages(_ENV_FIXES, lambda typo, correct: f"Env var: {typo} -> {correct}")
+    
+    # Requirements file names
+    _FILE_FIXES = {
+        'requirement.txt': 'requirements.txt',
+        'requir.txt': 'requirements.txt',
+        'requirements.tx': 'requirements.txt'
+    }
+    _FILE_MESSAGES = _fix_messages(_FILE_FIXES, lambda typo, correct: f"File: {typo} -> {correct}")
+    
+    # All typo tables go through one alternation, so the document is scanned once; the
+    # rank keeps fixes_applied grouped by table as when each table had its own pass
+    _TYPO_FIXES = {**_RUNNER_FIXES, **_ACTION_FIXES, **_ENV_FIXES, **_FILE_FIXES}
+    _TYPO_MESSAGES = {**_RUNNER_MESSAGES, **_ACTION_MESSAGES, **_ENV_MESSAGES, **_FILE_MESSAGES}
+    _TYPO_RANK = {typo: rank for rank, table in enumerate((_RUNNER_FIXES, _ACTION_FIXES, _ENV_FIXES, _FILE_FIXES))
+                  for typo in table}
+    _TYPO_RE = _typo_pattern(_TYPO_FIXES)
+    _TYPO_KEYS = tuple(_TYPO_FIXES)
+    _TYPO_DB = _typo_database(_TYPO_KEYS)
+    
+    _RE_REF_EQ = re.compile(r'(github\.ref)\s*=\s*([^=])')
+    _RE_EVENT_NAME_EQ = re.compile(r'(github\.event_name)\s*=\s*([^=])')
+    _RE_TIMEOUT = re.compile(r'\btimeout:\s*(\d+)')
+    _RE_EMPTY_ENV = re.compile(r'^[^\S\n]*environment:[^\S\n]*$', re.MULTILINE)
+    
+    _RE_BLANK_LINE = re.compile(r'^[^\S\n]+$', re.MULTILINE)
+    
     def __init__(self):
         self.fixes_applied = []
         
@@ -20,41 +155,21 @@ class EnterpriseGradeCICDAgent:
         print("🏭 Enterprise CI/CD Agent - Production Pipeline Repair")
         print("=" * 60)
         
-        current_content = content
-        total_fixes = 0
+        # A single pass is enough: every fixer skips text that is already correct, and
+        # none of them produces text another fixer would match (permissions expands to
+        # plain scope lines, environment gets a bare name), so a second pass finds nothing
+        fixes = [
+            self._fix_yaml_structure,
+            self._fix_typos,
+            self._fix_github_context_syntax,
+            self._fix_timeout_configurations,
+            self._fix_permissions,
+            self._fix_deployment_configs
+        ]
         
-        # Apply comprehensive fixes in multiple passes
-        for pass_num in range(1, 6):
-            print(f"🔄 Pass {pass_num}: Enterprise-level analysis...")
-            
-            # Store content before this pass
-            content_before_pass = current_content
-            fixes_before_pass = len(self.fixes_applied)
-            
-            # Apply all production-grade fixes
-            fixes = [
-                self._fix_yaml_structure,
-                self._fix_runner_specifications,
-                self._fix_action_versions,
-                self._fix_environment_variables,
-                self._fix_github_context_syntax,
-                self._fix_timeout_configurations,
-                self._fix_file_references,
-                self._fix_permissions,
-                self._fix_deployment_configs
-            ]
-            
-            for fix_func in fixes:
-                current_content = fix_func(current_content)
-            
-            # Count fixes applied in this pass
-            pass_fixes = len(self.fixes_applied) - fixes_before_pass
-            print(f"   Applied {pass_fixes} fixes in this pass")
-            
-            # If no fixes OR no content change, we're done
-            if pass_fixes == 0 or current_content == content_before_pass:
-                print("   ✅ No more fixes needed")
-                break
+        current_content = content
+        for fix_func in fixes:
+            current_content = fix_func(current_content)
         
         # Final enterprise validation and cleanup
         current_content = self._enterprise_cleanup(current_content)
@@ -74,117 +189,73 @@ class EnterpriseGradeCICDAgent:
         
         return content
     
-    def _fix_runner_specifications(self, content: str) -> str:
-        """Fix runner specifications"""
-        # Fix common runner typos with precise matching to avoid cascading fixes
-        runner_fixes = [
-            ('runs-on: ubuntu-lat', 'runs-on: ubuntu-latest'),
-            ('runs-on: ubuntu-20', 'runs-on: ubuntu-20.04'),
-            ('runs-on: ubuntu-22', 'runs-on: ubuntu-22.04'),
-            ('runs-on: windows-lates', 'runs-on: windows-latest'),
-            ('runs-on: macos-lates', 'runs-on: macos-latest'),
-            ('os: [ubuntu-lat', 'os: [ubuntu-latest'),
-            ('- ubuntu-lat', '- ubuntu-latest'),
-            ('- windows-lates', '- windows-latest'),
-            ('- macos-lates', '- macos-latest')
-        ]
+    def _fix_typos(self, content: str) -> str:
+        """Fix runner, action version, env var and file name typos in one scan"""
+        table = self._TYPO_FIXES
+        seen = {}  # Insertion-ordered set of the typos matched
+        parts = []
+        last = 0
+        for start, end, typo in self._iter_typo_spans(content):
+            parts.append(content[last:start])
+            parts.append(table[typo])
+            last = end
+            seen[typo] = None
         
-        for incorrect, correct in runner_fixes:
-            if incorrect in content:
-                content = content.replace(incorrect, correct)
-                self.fixes_applied.append(f"Runner: {incorrect.split(': ')[-1] if ': ' in incorrect else incorrect} -> {correct.split(': ')[-1] if ': ' in correct else correct}")
+        if not parts:
+            return content
         
-        return content
+        parts.append(content[last:])
+        self.fixes_applied.extend(self._TYPO_MESSAGES[typo] for typo in sorted(seen, key=self._TYPO_RANK.get))
+        
+        return ''.join(parts)
     
-    def _fix_action_versions(self, content: str) -> str:
-        """Fix action version specifications"""
-        # Fix incomplete action versions with context-aware matching
-        action_fixes = [
-            ('uses: actions/checkout@', 'uses: actions/checkout@v4'),
-            ('uses: actions/setup-node@', 'uses: actions/setup-node@v4'),
-            ('uses: actions/setup-python@', 'uses: actions/setup-python@v5'),
-            ('uses: actions/cache@', 'uses: actions/cache@v4'),
-            ('uses: actions/upload-artifact@', 'uses: actions/upload-artifact@v4'),
-            ('uses: docker/setup-buildx-action@', 'uses: docker/setup-buildx-action@v3'),
-            ('uses: docker/login-action@', 'uses: docker/login-action@v3'),
-            ('uses: docker/build-push-action@', 'uses: docker/build-push-action@v5'),
-            ('uses: hashicorp/setup-terraform@', 'uses: hashicorp/setup-terraform@v3'),
-            ('uses: aquasecurity/trivy-action@', 'uses: aquasecurity/trivy-action@master'),
-            ('uses: gitleaks/gitleaks-action@v', 'uses: gitleaks/gitleaks-action@v2'),
-            ('uses: anchore/sbom-action@', 'uses: anchore/sbom-action@v0'),
-            ('uses: github/codeql-action/upload-sarif@', 'uses: github/codeql-action/upload-sarif@v3'),
-            ('uses: codecov/codecov-action@', 'uses: codecov/codecov-action@v4'),
-            ('uses: 8398a7/action-slack@', 'uses: 8398a7/action-slack@v3')
-        ]
+    def _iter_typo_spans(self, content: str):
+        """Yield (start, end, typo) for non-overlapping typos, leftmost and longest first"""
+        # Hyperscan offsets are byte offsets, so only ASCII documents go through it
+        if self._TYPO_DB is None or not content.isascii():
+            for match in self._TYPO_RE.finditer(content):
+                yield match.start(), match.end(), match.group()
+            return
         
-        for incomplete, complete in action_fixes:
-            if incomplete in content:
-                content = content.replace(incomplete, complete)
-                action_name = incomplete.replace('uses: ', '').replace('@', '').replace('@v', '')
-                self.fixes_applied.append(f"Action: {action_name}@ -> {complete.split('@')[1]}")
+        keys = self._TYPO_KEYS
+        hits = []
         
-        return content
-    
-    def _fix_environment_variables(self, content: str) -> str:
-        """Fix environment variable names and syntax"""
-        # Fix environment variable name typos (only once)
-        env_fixes = {
-            'NODE_VERSIO': 'NODE_VERSION',
-            'PYTHON_VERSIO': 'PYTHON_VERSION',
-            'REGISTR': 'REGISTRY', 
-            'IMAGE_NAM': 'IMAGE_NAME',
-            'TERRAFORM_VERSIO': 'TERRAFORM_VERSION',
-            'KUBECTL_VERSIO': 'KUBECTL_VERSION',
-            'HELM_VERSIO': 'HELM_VERSION',
-            'PYTHONPTH': 'PYTHONPATH'
-        }
+        def on_match(typo_id, start, end, flags, context):
+            hits.append((start, -len(keys[typo_id]), typo_id))
         
-        for typo, correct in env_fixes.items():
-            # Only fix if typo exists and correct version doesn't exist
-            if typo in content and correct + 'N' not in content:  # Prevent VERSIONNN
-                content = content.replace(typo, correct)
-                self.fixes_applied.append(f"Env var: {typo} -> {correct}")
+        self._TYPO_DB.scan(content.encode('ascii'), match_event_handler=on_match)
         
-        return content
+        # Same choice the longest-first alternation makes when scanning left to right
+        last = 0
+        for start, negative_length, typo_id in sorted(hits):
+            if start >= last:
+                last = start - negative_length
+                yield start, last, keys[typo_id]
     
     def _fix_github_context_syntax(self, content: str) -> str:
         """Fix GitHub context comparison syntax"""
-        original_content = content
+        fixed = 0
         
-        # Fix single = to == in conditions
-        content = re.sub(r'(github\.ref)\s*=\s*([^=])', r'\1 == \2', content)
-        content = re.sub(r'(github\.event_name)\s*=\s*([^=])', r'\1 == \2', content)
+        # Fix single = to == in conditions; the substring checks skip the regex on clean files
+        if 'github.ref' in content:
+            content, count = self._RE_REF_EQ.subn(r'\1 == \2', content)
+            fixed += count
+        if 'github.event_name' in content:
+            content, count = self._RE_EVENT_NAME_EQ.subn(r'\1 == \2', content)
+            fixed += count
         
-        if content != original_content:
+        if fixed:
             self.fixes_applied.append("GitHub context: = -> ==")
         
         return content
     
     def _fix_timeout_configurations(self, content: str) -> str:
         """Fix timeout configurations"""
-        original_content = content
-        
         # Fix timeout: to timeout-minutes:
-        content = re.sub(r'\btimeout:\s*(\d+)', r'timeout-minutes: \1', content)
-        
-        if content != original_content:
-            self.fixes_applied.append("Timeout: timeout -> timeout-minutes")
-        
-        return content
-    
-    def _fix_file_references(self, content: str) -> str:
-        """Fix file name references"""
-        # Fix requirements file names
-        file_fixes = {
-            'requirement.txt': 'requirements.txt',
-            'requir.txt': 'requirements.txt',
-            'requirements.tx': 'requirements.txt'
-        }
-        
-        for typo, correct in file_fixes.items():
-            if typo in content:
-                content = content.replace(typo, correct)
-                self.fixes_applied.append(f"File: {typo} -> {correct}")
+        if 'timeout:' in content:
+            content, count = self._RE_TIMEOUT.subn(r'timeout-minutes: \1', content)
+            if count:
+                self.fixes_applied.append("Timeout: timeout -> timeout-minutes")
         
         return content
     
@@ -203,7 +274,9 @@ class EnterpriseGradeCICDAgent:
         """Fix deployment configurations"""
         # Fix deployment environments that need values
         # But avoid workflow_dispatch inputs and environment objects
-        import re
+        # Only walk the lines when some environment: actually has no value
+        if 'environment:' not in content or not self._RE_EMPTY_ENV.search(content):
+            return content
         
         lines = content.split('\n')
         modified = False
@@ -221,7 +294,7 @@ class EnterpriseGradeCICDAgent:
                 continue
                 
             # Look for standalone environment: with no value in job contexts
-            if re.match(r'^\s*environment:\s*$', line):
+            if self._RE_EMPTY_ENV.match(line):
                 # Check next line to see if it's an object property
                 next_line_idx = i + 1
                 if next_line_idx < len(lines):
@@ -245,32 +318,25 @@ class EnterpriseGradeCICDAgent:
         """Final enterprise-level cleanup"""
         print("🧹 Enterprise cleanup and validation...")
         
-        # Fix any remaining syntax issues
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Skip completely empty lines in some contexts
-            if line.strip():
-                cleaned_lines.append(line)
-            else:
-                cleaned_lines.append('')
-        
-        return '\n'.join(cleaned_lines)
+        # Whitespace-only lines become empty lines
+        return self._RE_BLANK_LINE.sub('', content)
     
     def validate_enterprise_pipeline(self, content: str) -> Dict:
         """Validate the pipeline meets enterprise standards"""
+        # Imported here: only validation parses YAML, the fixers work on the raw text
+        import yaml
+        
         try:
-            workflow = yaml.safe_load(content)
+            workflow = yaml.load(content, Loader=_yaml_loader())
+            jobs = workflow.get('jobs', {})
+            job_names = [job_name.lower() for job_name in jobs]
             
             validations = {
                 'yaml_valid': True,
-                'has_multiple_jobs': len(workflow.get('jobs', {})) > 1,
-                'has_security_job': any('security' in job_name.lower() or 'scan' in job_name.lower() 
-                                       for job_name in workflow.get('jobs', {}).keys()),
-                'has_matrix_build': any('matrix' in str(job) for job in workflow.get('jobs', {}).values()),
-                'has_deployment': any('deploy' in job_name.lower() 
-                                    for job_name in workflow.get('jobs', {}).keys()),
+                'has_multiple_jobs': len(jobs) > 1,
+                'has_security_job': any('security' in job_name or 'scan' in job_name for job_name in job_names),
+                'has_matrix_build': any(_has_matrix(job) for job in jobs.values()),
+                'has_deployment': any('deploy' in job_name for job_name in job_names),
                 'proper_permissions': 'permissions' in workflow and workflow['permissions'] != 'write-all'
             }
             
@@ -279,6 +345,31 @@ class EnterpriseGradeCICDAgent:
         except yaml.YAMLError:
             return {'yaml_valid': False}
 
+# Issues seeded into test_complex_pipeline.yml, used to score the fixed output
+_ORIGINAL_ISSUES = (
+    "'on':", "ubuntu-lat", "actions/checkt", "actions/checkout@", 
+    "actions/setup-python@", "NODE_VERSIO", "PYTHON_VERSIO", "REGISTR",
+    "IMAGE_NAM", "PYTHONPTH", "requirement.txt", "timeout:", 
+    "github.ref =", "github.event_name =", "securecodewarrior/github-action-add-sarif@v",
+    "actions/cache@", "actions/setup-node@", "azure/k8s-deploy@v", "azure/k8s-deploy@"
+)
+
+if ahocorasick is not None:
+    _ISSUES_AUTOMATON = ahocorasick.Automaton()
+    for _index, _issue in enumerate(_ORIGINAL_ISSUES):
+        _ISSUES_AUTOMATON.add_word(_issue, _index)
+    _ISSUES_AUTOMATON.make_automaton()
+else:
+    _ISSUES_AUTOMATON = None
+
+
+def _count_remaining_issues(content: str) -> int:
+    """Number of distinct original issues still present, found in one pass when possible"""
+    if _ISSUES_AUTOMATON is None:
+        return sum(1 for issue in _ORIGINAL_ISSUES if issue in content)
+    return len({index for _, index in _ISSUES_AUTOMATON.iter(content)})
+
+
 def test_enterprise_agent():
     """Test the enterprise-grade CI/CD agent"""
     
@@ -304,17 +395,9 @@ def test_enterprise_agent():
         print(f"   ✅ {fix}")
     
     # Calculate success rate
-    original_issues = [
-        "'on':", "ubuntu-lat", "actions/checkt", "actions/checkout@", 
-        "actions/setup-python@", "NODE_VERSIO", "PYTHON_VERSIO", "REGISTR",
-        "IMAGE_NAM", "PYTHONPTH", "requirement.txt", "timeout:", 
-        "github.ref =", "github.event_name =", "securecodewarrior/github-action-add-sarif@v",
-        "actions/cache@", "actions/setup-node@", "azure/k8s-deploy@v", "azure/k8s-deploy@"
-    ]
-    
-    issues_remaining = sum(1 for issue in original_issues if issue in fixed_workflow)
-    issues_fixed = len(original_issues) - issues_remaining
-    success_rate = (issues_fixed / len(original_issues) * 100)
+    issues_remaining = _count_remaining_issues(fixed_workflow)
+    issues_fixed = len(_ORIGINAL_ISSUES) - issues_remaining
+    success_rate = (issues_fixed / len(_ORIGINAL_ISSUES) * 100)
     
     print(f"\n📊 Production Pipeline Success Rate: {success_rate:.1f}%")
     
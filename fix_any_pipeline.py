@@ -14,6 +14,11 @@ def fix_my_pipeline(file_path):
     agent = EnterpriseGradeCICDAgent()
     fixed_content = agent.fix_production_pipeline(content)
     
+    # Nothing to fix, leave the file (and its mtime) untouched
+    if fixed_content == content:
+        print(f"✅ {file_path} is already production-ready, no changes needed")
+        return
+    
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(fixed_content)
     
@@ -1,16 +1,35 @@
 """
 Advanced Semantic Validation for CI/CD Workflows
 Deep analysis beyond basic YAML syntax checking
+
+Parsing uses the libyaml bindings when PyYAML was built against libyaml
+(pip install pyyaml with libyaml-dev present); otherwise the pure-Python
+SafeLoader is used with the same results, just slower.
 """
 import yaml
+import math
 import re
-import requests
-import json
+from itertools import islice
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import semver
-from packaging import version
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Checks applied to every line of a step's run: block
+_RE_BAD_REQS = re.compile(r'pip install.*requirements\.tx')
+_RE_BAD_EXPORT = re.compile(r'export\s+\w+=["\']?\$\{\w*\}\s*$')
+_RE_UNQUOTED_VAR = re.compile(r'\$\{[^}]*[:\s][^}]*\}')
+_RE_QUOTED_VAR = re.compile(r'["\'].*\$\{[^}]*[:\s][^}]*\}.*["\']')
+
+# Any of the checks above, over a whole run: block; most blocks never match
+_RE_RUN_ISSUES = re.compile(
+    '|'.join(p.pattern for p in (_RE_BAD_REQS, _RE_BAD_EXPORT, _RE_UNQUOTED_VAR)),
+    re.MULTILINE
+)
 
 class ValidationLevel(Enum):
     BASIC = "basic"
@@ -20,6 +39,9 @@ class ValidationLevel(Enum):
 
 @dataclass
 class ValidationResult:
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('is_valid', 'errors', 'warnings', 'suggestions', 'severity_score')
+    
     is_valid: bool
     errors: List[str]
     warnings: List[str]
@@ -33,11 +55,16 @@ class AdvancedSemanticValidator:
         self.validation_level = validation_level
         self.github_actions_registry = self._load_action_registry()
         self.runner_specifications = self._load_runner_specs()
+        self._runners_lower = tuple((r.lower(), r) for r in self.runner_specifications)
         self.python_versions = self._get_supported_python_versions()
+        self._valid_triggers = frozenset([
+            'push', 'pull_request', 'pull_request_target', 'release', 
+            'schedule', 'workflow_dispatch', 'workflow_call', 'repository_dispatch'
+        ])
     
     def _load_action_registry(self) -> Dict[str, Dict]:
         """Load known GitHub Actions with their latest versions and specs"""
-        return {
+        registry = {
             "actions/checkout": {
                 "latest_version": "v4",
                 "supported_versions": ["v3", "v4"],
@@ -74,6 +101,16 @@ class AdvancedSemanticValidator:
                 "optional_inputs": ["path", "if-no-files-found", "retention-days", "compression-level", "overwrite"]
             }
         }
+        
+        # Membership checks use sets; required inputs keep their order so
+        # missing-input errors are reported in a stable order
+        for spec in registry.values():
+            spec["required_inputs"] = tuple(spec["required_inputs"])
+            spec["optional_inputs"] = frozenset(spec["optional_inputs"])
+            spec["deprecated_versions"] = frozenset(spec["deprecated_versions"])
+            spec["all_inputs"] = spec["optional_inputs"].union(spec["required_inputs"])
+        
+        return registry
     
     def _load_runner_specs(self) -> Dict[str, Dict]:
         """Load runner specifications and their capabilities"""
@@ -105,16 +142,28 @@ class AdvancedSemanticValidator:
         
         try:
             # Parse YAML
-            workflow = yaml.safe_load(workflow_content)
+            workflow = yaml.load(workflow_content, Loader=_YamlLoader)
             
             # Core validations
             errors.extend(self._validate_workflow_structure(workflow))
             errors.extend(self._validate_triggers(workflow.get('on', {})))
-            errors.extend(self._validate_jobs(workflow.get('jobs', {})))
             
-            # Warnings and suggestions
-            warnings.extend(self._check_best_practices(workflow))
-            suggestions.extend(self._suggest_improvements(workflow))
+            # Jobs: validation, best practices and suggestions in one pass
+            jobs = workflow.get('jobs', {})
+            if not jobs:
+                errors.append("Workflow has no jobs defined")
+            
+            for job_name, job_config, steps in self._walk_jobs(jobs):
+                errors.extend(self._validate_single_job(job_name, job_config))
+                
+                # Check for missing timeout
+                if 'timeout-minutes' not in job_config:
+                    warnings.append(f"Job '{job_name}': Consider adding timeout-minutes to prevent hanging")
+                
+                # Suggest caching for dependency installation
+                has_pip_install, has_cache = self._scan_job_steps(steps)
+                if has_pip_install and not has_cache:
+                    suggestions.append(f"Job '{job_name}': Consider adding actions/cache for pip dependencies")
             
             # Calculate severity score
             severity_score = len(errors) * 20 + len(warnings) * 5
@@ -134,6 +183,11 @@ class AdvancedSemanticValidator:
             severity_score=severity_score
         )
     
+    def validate_workflows(self, workflow_contents: List[str]) -> List[ValidationResult]:
+        """Validate several workflows, one result per input in the same order"""
+        validate = self.validate_workflow
+        return [validate(content) for content in workflow_contents]
+    
     def _validate_workflow_structure(self, workflow: Dict[str, Any]) -> List[str]:
         """Validate basic workflow structure"""
         errors = []
@@ -154,11 +208,7 @@ class AdvancedSemanticValidator:
             return errors
         
         # Validate trigger types
-        valid_triggers = [
-            'push', 'pull_request', 'pull_request_target', 'release', 
-            'schedule', 'workflow_dispatch', 'workflow_call', 'repository_dispatch'
-        ]
-        
+        valid_triggers = self._valid_triggers
         for trigger in triggers:
             if trigger not in valid_triggers:
                 errors.append(f"Unknown trigger type: '{trigger}'")
@@ -185,18 +235,22 @@ class AdvancedSemanticValidator:
                     if not isinstance(branch, str):
                         errors.append(f"Invalid branch specification in {trigger_type}: {branch}")
     
-    def _validate_jobs(self, jobs: Dict[str, Any]) -> List[str]:
-        """Validate workflow jobs"""
-        errors = []
-        
-        if not jobs:
-            errors.append("Workflow has no jobs defined")
-            return errors
-        
+    def _walk_jobs(self, jobs: Dict[str, Any]):
+        """Yield (job_name, job_config, steps) for each job"""
         for job_name, job_config in jobs.items():
-            errors.extend(self._validate_single_job(job_name, job_config))
-        
-        return errors
+            yield job_name, job_config, job_config.get('steps', [])
+    
+    def _scan_job_steps(self, steps: List[Dict]) -> Tuple[bool, bool]:
+        """Return (has_pip_install, has_cache), stopping once both are found"""
+        has_pip_install = has_cache = False
+        for step in steps:
+            if not has_pip_install and 'pip install' in step.get('run', ''):
+                has_pip_install = True
+            if not has_cache and 'actions/cache' in step.get('uses', ''):
+                has_cache = True
+            if has_pip_install and has_cache:
+                break
+        return has_pip_install, has_cache
     
     def _validate_single_job(self, job_name: str, job_config: Dict[str, Any]) -> List[str]:
         """Validate a single job configuration"""
@@ -225,9 +279,12 @@ class AdvancedSemanticValidator:
         if runner not in self.runner_specifications:
             errors.append(f"Unknown runner: '{runner}'")
             # Suggest similar runners
-            suggestions = [r for r in self.runner_specifications.keys() if runner.lower() in r.lower()]
+            runner_lower = runner.lower()
+            suggestions = list(islice(
+                (r for r_lower, r in self._runners_lower if runner_lower in r_lower), 3
+            ))
             if suggestions:
-                errors.append(f"Did you mean: {', '.join(suggestions[:3])}?")
+                errors.append(f"Did you mean: {', '.join(suggestions)}?")
         else:
             runner_spec = self.runner_specifications[runner]
             if not runner_spec.get('supported', True):
@@ -252,18 +309,22 @@ class AdvancedSemanticValidator:
     def _validate_single_step(self, step: Dict[str, Any], job_name: str, step_num: int) -> List[str]:
         """Validate a single step"""
         errors = []
-        prefix = f"Job '{job_name}', Step {step_num}"
+        has_uses = 'uses' in step
+        has_run = 'run' in step
         
         # Either 'uses' or 'run' is required
-        if 'uses' not in step and 'run' not in step:
-            errors.append(f"{prefix}: Must have either 'uses' or 'run'")
+        if not has_uses and not has_run:
+            errors.append(f"Job '{job_name}', Step {step_num}: Must have either 'uses' or 'run'")
+            return errors
+        
+        prefix = f"Job '{job_name}', Step {step_num}"
         
         # Validate action usage
-        if 'uses' in step:
+        if has_uses:
             errors.extend(self._validate_action_usage(step['uses'], step.get('with', {}), prefix))
         
         # Validate shell commands
-        if 'run' in step:
+        if has_run:
             errors.extend(self._validate_run_commands(step['run'], prefix))
         
         return errors
@@ -277,24 +338,23 @@ class AdvancedSemanticValidator:
             errors.append(f"{prefix}: Action '{action}' missing version tag")
             return errors
         
-        action_name, version = action.split('@', 1)
+        action_name, ver = action.split('@', 1)
         
         if action_name in self.github_actions_registry:
             action_spec = self.github_actions_registry[action_name]
             
             # Check if version is supported
-            if version in action_spec.get('deprecated_versions', []):
+            if ver in action_spec['deprecated_versions']:
                 latest = action_spec.get('latest_version', 'latest')
-                errors.append(f"{prefix}: Action version '{version}' is deprecated. Use '{latest}'")
+                errors.append(f"{prefix}: Action version '{ver}' is deprecated. Use '{latest}'")
             
             # Validate required inputs
-            required_inputs = action_spec.get('required_inputs', [])
-            for required_input in required_inputs:
+            for required_input in action_spec['required_inputs']:
                 if required_input not in inputs:
                     errors.append(f"{prefix}: Missing required input '{required_input}' for {action}")
             
             # Check for invalid inputs
-            valid_inputs = action_spec.get('required_inputs', []) + action_spec.get('optional_inputs', [])
+            valid_inputs = action_spec['all_inputs']
             for input_name in inputs:
                 if input_name not in valid_inputs:
                     errors.append(f"{prefix}: Unknown input '{input_name}' for {action}")
@@ -305,21 +365,24 @@ class AdvancedSemanticValidator:
         """Validate shell commands in run steps"""
         errors = []
         
+        if not _RE_RUN_ISSUES.search(commands):
+            return errors
+        
         lines = commands.strip().split('\n')
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 continue
             
             # Check for common issues
-            if re.search(r'pip install.*requirements\.tx', line):
+            if _RE_BAD_REQS.search(line):
                 errors.append(f"{prefix}, Line {line_num}: Invalid requirements file 'requirements.tx'")
             
-            if re.search(r'export\s+\w+=["\']?\$\{\w*\}\s*$', line):
+            if _RE_BAD_EXPORT.search(line):
                 errors.append(f"{prefix}, Line {line_num}: Incomplete environment variable export")
             
             # Check for unquoted variables with special characters
-            if re.search(r'\$\{[^}]*[:\s][^}]*\}', line) and not re.search(r'["\'].*\$\{[^}]*[:\s][^}]*\}.*["\']', line):
+            if _RE_UNQUOTED_VAR.search(line) and not _RE_QUOTED_VAR.search(line):
                 errors.append(f"{prefix}, Line {line_num}: Environment variable with special characters should be quoted")
         
         return errors
@@ -337,41 +400,14 @@ class AdvancedSemanticValidator:
             return errors
         
         # Validate matrix size
-        total_combinations = 1
-        for key, values in matrix.items():
-            if isinstance(values, list):
-                total_combinations *= len(values)
+        total_combinations = math.prod(
+            len(values) for values in matrix.values() if isinstance(values, list)
+        )
         
         if total_combinations > 256:
             errors.append(f"Job '{job_name}': Matrix has {total_combinations} combinations, exceeding GitHub's 256 limit")
         
         return errors
-    
-    def _check_best_practices(self, workflow: Dict[str, Any]) -> List[str]:
-        """Check for best practice violations"""
-        warnings = []
-        
-        # Check for missing timeout
-        for job_name, job_config in workflow.get('jobs', {}).items():
-            if 'timeout-minutes' not in job_config:
-                warnings.append(f"Job '{job_name}': Consider adding timeout-minutes to prevent hanging")
-        
-        return warnings
-    
-    def _suggest_improvements(self, workflow: Dict[str, Any]) -> List[str]:
-        """Suggest workflow improvements"""
-        suggestions = []
-        
-        # Suggest caching for dependency installation
-        for job_name, job_config in workflow.get('jobs', {}).items():
-            steps = job_config.get('steps', [])
-            has_pip_install = any('pip install' in step.get('run', '') for step in steps)
-            has_cache = any('actions/cache' in step.get('uses', '') for step in steps)
-            
-            if has_pip_install and not has_cache:
-                suggestions.append(f"Job '{job_name}': Consider adding actions/cache for pip dependencies")
-        
-        return suggestions
 
 # Export for use in other modules
 __all__ = ['AdvancedSemanticValidator', 'ValidationResult', 'ValidationLevel']
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Auto-learned fixes based on continuous learning
+The pattern table lives in auto_learned_patterns.json (written by AgentAutoUpdater);
+this loader stays unchanged across updates
+"""
+
+import json
+import re
+from importlib import resources
+from typing import Callable, Dict, Optional
+
+try:
+    import ahocorasick  # pyahocorasick, optional
+except ImportError:
+    ahocorasick = None
+
+
+def _load_patterns():
+    """Load (old, new, confidence) rows, empty until the first update has run"""
+    try:
+        table = resources.files(__package__).joinpath("auto_learned_patterns.json")
+        data = json.loads(table.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return []
+    return [(p['old'], p['new'], p['confidence']) for p in data['patterns']]
+
+
+_PATTERNS = _load_patterns()
+
+# Single-character swaps go through one str.translate pass, the rest through the matcher
+_CHAR_REPLACEMENTS = dict(
+    (old, new) for old, new, _ in _PATTERNS if len(old) == 1 and len(new) == 1
+)
+_TRANSLATE_TABLE = str.maketrans(_CHAR_REPLACEMENTS)
+
+_REPLACEMENTS = dict(
+    (old, new) for old, new, _ in _PATTERNS if old not in _CHAR_REPLACEMENTS
+)
+
+
+def build_replacer(table: Dict[str, str]) -> Callable[..., str]:
+    """Build replace(content, on_match=None) applying every old → new of table in one pass
+    
+    Overlapping keys prefer the longest match. on_match(old) is called once per
+    distinct key found. Matching uses a pyahocorasick automaton when installed,
+    a longest-first regex alternation otherwise.
+    """
+    if not table:
+        return lambda content, on_match=None: content
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for old in table:
+            automaton.add_word(old, old)
+        automaton.make_automaton()
+        
+        def find_matches(content):
+            for end, old in automaton.iter_long(content):
+                yield end - len(old) + 1, end + 1, old
+    else:
+        # Longest alternatives first so overlapping patterns prefer the longest match
+        regex = re.compile('|'.join(
+            re.escape(old) for old in sorted(table, key=len, reverse=True)
+        ))
+        
+        def find_matches(content):
+            for match in regex.finditer(content):
+                yield match.start(), match.end(), match.group()
+    
+    def replace(content: str, on_match: Optional[Callable[[str], None]] = None) -> str:
+        parts = []
+        applied = set()
+        last = 0
+        for start, end, old in find_matches(content):
+            parts.append(content[last:start])
+            parts.append(table[old])
+            last = end
+            if on_match is not None and old not in applied:
+                applied.add(old)
+                on_match(old)
+        
+        if not parts:
+            return content
+        
+        parts.append(content[last:])
+        return ''.join(parts)
+    
+    return replace
+
+
+# Matcher is built once at import rather than on every call
+_replace = build_replacer(_REPLACEMENTS)
+
+
+class AutoLearnedFixes:
+    """Table-driven fixes from continuous learning"""
+    
+    def __init__(self, fixes_log: list = None):
+        # Callers may pass their own list so applied fixes are logged in place
+        self.fixes_applied = fixes_log if fixes_log is not None else []
+    
+    def apply_all_learned_fixes(self, content: str) -> str:
+        """Apply all auto-learned fixes: one translate pass, then one matcher pass"""
+        if _CHAR_REPLACEMENTS:
+            for old, new in _CHAR_REPLACEMENTS.items():
+                if old in content:
+                    self.fixes_applied.append(f"Auto-learned: {old} → {new}")
+            content = content.translate(_TRANSLATE_TABLE)
+        
+        log = self.fixes_applied.append
+        return _replace(content, lambda old: log(f"Auto-learned: {old} → {_REPLACEMENTS[old]}"))
@@ -6,6 +6,71 @@ from typing import Dict, List, Optional
 from loguru import logger
 from .log_analyzer import ErrorCategory
 
+# Returned for categories without a dedicated entry; shared, so treat as read-only
+_DEFAULT_FIX_SPEC = {
+    "description": "Unknown error type",
+    "suggestions": ["Review logs manually for more details"],
+    "auto_fixable": False
+}
+
+_CATEGORY_VALUES = frozenset(category.value for category in ErrorCategory)
+
+# Fix texts are built once; only the variable parts are filled in per call
+_DEPENDENCY_FIX_TEMPLATE = """
+To fix the missing dependency '{missing_module}':
+
+1. Add to requirements.txt:
+   {missing_module}
+
+2. Update your workflow to install it:
+   - name: Install Dependencies
+     run: |
+       pip install -r requirements.txt
+
+3. Commit and push the changes
+""".strip()
+
+_TIMEOUT_FIX_TEMPLATE = """
+To fix timeout issues:
+
+1. Increase the timeout in your workflow:
+   jobs:
+     your-job:
+       timeout-minutes: {recommended_timeout}
+       
+2. Or for specific steps:
+   - name: Your Step
+     timeout-minutes: {recommended_timeout}
+     run: your-command
+
+3. Consider optimizing:
+   - Use caching for dependencies
+   - Split into parallel jobs
+   - Remove unnecessary operations
+""".strip()
+
+_TIMEOUT_FIX_DEFAULT = _TIMEOUT_FIX_TEMPLATE.format(recommended_timeout=30)
+
+_PERMISSION_FIX = """
+To fix permission issues:
+
+1. Add permissions to your workflow:
+   permissions:
+     contents: write
+     pull-requests: write
+     issues: write
+
+2. Or for specific jobs:
+   jobs:
+     your-job:
+       permissions:
+         contents: read
+
+3. Verify repository settings:
+   - Check if Actions have necessary permissions
+   - Review organization/repository access policies
+""".strip()
+
 
 class ErrorFixer:
     """Generates fix suggestions based on error categories"""
@@ -125,6 +190,14 @@ class ErrorFixer:
     
     def __init__(self):
         self.fix_suggestions = self.FIX_SUGGESTIONS
+        # Callers pass category strings, so index by enum value up front
+        self._by_str = {
+            category.value: spec for category, spec in self.FIX_SUGGESTIONS.items()
+        }
+        self._auto_fixable = frozenset(
+            category.value for category, spec in self.FIX_SUGGESTIONS.items()
+            if spec["auto_fixable"]
+        )
     
     def get_fix_suggestions(self, error_category: str) -> Dict[str, any]:
         """
@@ -136,22 +209,14 @@ class ErrorFixer:
         Returns:
             Dictionary with fix suggestions
         """
-        try:
-            category_enum = ErrorCategory(error_category)
-            suggestions = self.fix_suggestions.get(category_enum, {
-                "description": "Unknown error type",
-                "suggestions": ["Review logs manually for more details"],
-                "auto_fixable": False
-            })
-            logger.info(f"Generated fix suggestions for category: {error_category}")
-            return suggestions
-        except ValueError:
-            logger.warning(f"Unknown error category: {error_category}")
-            return {
-                "description": "Unknown error type",
-                "suggestions": ["Review logs manually for more details"],
-                "auto_fixable": False
-            }
+        suggestions = self._by_str.get(error_category)
+        if suggestions is None:
+            if error_category not in _CATEGORY_VALUES:
+                logger.warning(f"Unknown error category: {error_category}")
+                return _DEFAULT_FIX_SPEC
+            suggestions = _DEFAULT_FIX_SPEC
+        logger.info(f"Generated fix suggestions for category: {error_category}")
+        return suggestions
     
     def generate_fix_report(self, analysis_result: Dict) -> Dict[str, any]:
         """
@@ -172,11 +237,12 @@ class ErrorFixer:
         }
         
         # Generate fixes for each category
-        for category in analysis_result.get("categories", []):
-            fix_info = self.get_fix_suggestions(category)
-            report["fixes"][category] = fix_info
+        fixes = report["fixes"]
+        auto_fixable = self._auto_fixable
+        for category in report["categories"]:
+            fixes[category] = self.get_fix_suggestions(category)
             
-            if fix_info["auto_fixable"]:
+            if category in auto_fixable:
                 report["auto_fixable_count"] += 1
             else:
                 report["manual_review_count"] += 1
@@ -196,20 +262,7 @@ class ErrorFixer:
         Returns:
             Suggested fix as string
         """
-        fix = f"""
-To fix the missing dependency '{missing_module}':
-
-1. Add to requirements.txt:
-   {missing_module}
-
-2. Update your workflow to install it:
-   - name: Install Dependencies
-     run: |
-       pip install -r requirements.txt
-
-3. Commit and push the changes
-"""
-        return fix.strip()
+        return _DEPENDENCY_FIX_TEMPLATE.format(missing_module=missing_module)
     
     def suggest_timeout_fix(self, current_timeout: Optional[int] = None) -> str:
         """
@@ -221,27 +274,9 @@ To fix the missing dependency '{missing_module}':
         Returns:
             Suggested fix as string
         """
-        recommended_timeout = (current_timeout * 2) if current_timeout else 30
-        
-        fix = f"""
-To fix timeout issues:
-
-1. Increase the timeout in your workflow:
-   jobs:
-     your-job:
-       timeout-minutes: {recommended_timeout}
-       
-2. Or for specific steps:
-   - name: Your Step
-     timeout-minutes: {recommended_timeout}
-     run: your-command
-
-3. Consider optimizing:
-   - Use caching for dependencies
-   - Split into parallel jobs
-   - Remove unnecessary operations
-"""
-        return fix.strip()
+        if not current_timeout:
+            return _TIMEOUT_FIX_DEFAULT
+        return _TIMEOUT_FIX_TEMPLATE.format(recommended_timeout=current_timeout * 2)
     
     def suggest_permission_fix(self) -> str:
         """
@@ -250,26 +285,7 @@ To fix timeout issues:
         Returns:
             Suggested fix as string
         """
-        fix = """
-To fix permission issues:
-
-1. Add permissions to your workflow:
-   permissions:
-     contents: write
-     pull-requests: write
-     issues: write
-
-2. Or for specific jobs:
-   jobs:
-     your-job:
-       permissions:
-         contents: read
-
-3. Verify repository settings:
-   - Check if Actions have necessary permissions
-   - Review organization/repository access policies
-"""
-        return fix.strip()
+        return _PERMISSION_FIX
     
     def generate_workflow_fix(self, error_category: str, context: Dict = None) -> Optional[str]:
         """
@@ -2,11 +2,27 @@
 GitHub Integration Module
 Handles GitHub API interactions for workflow monitoring and PR creation
 """
+import io
 import os
-from typing import Dict, List, Optional, Tuple
+import shutil
+import tempfile
+import weakref
+import zipfile
+from datetime import date
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 from github import Github, GithubException
 from loguru import logger
 import requests
+from requests.adapters import HTTPAdapter
+
+# Largest page size the REST API accepts; fewer round trips per run listing
+_RUNS_PER_PAGE = 100
+
+# Concurrent log downloads; the HTTP pool is sized to match so connections are reused
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Log archives up to this size stay in memory, larger ones spill to a temp file
+_LOG_SPOOL_SIZE = 8 * 1024 * 1024
 
 
 class GitHubIntegration:
@@ -23,13 +39,24 @@ class GitHubIntegration:
         self.token = token or os.environ.get("GITHUB_TOKEN")
         self.repo_name = repo_name or os.environ.get("GITHUB_REPOSITORY")
         
+        # One keep-alive session shared by all log downloads (thread-safe for GETs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=MAX_CONCURRENT_DOWNLOADS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # run_id -> (ETag, archive path) for conditional log re-fetches; archives live
+        # in a temp directory created on first use and removed with this object
+        self._log_cache: Dict[int, Tuple[str, str]] = {}
+        self._log_cache_dir: Optional[str] = None
+        
         if not self.token:
             logger.warning("No GitHub token provided. Some operations may fail.")
             self.github = None
             self.repo = None
         else:
             try:
-                self.github = Github(self.token)
+                self.github = Github(self.token, per_page=_RUNS_PER_PAGE)
                 if self.repo_name:
                     self.repo = self.github.get_repo(self.repo_name)
                     logger.info(f"Connected to repository: {self.repo_name}")
@@ -41,13 +68,24 @@ class GitHubIntegration:
                 self.github = None
                 self.repo = None
     
-    def get_workflow_runs(self, status: str = "failure", max_results: int = 10) -> List[Dict]:
+    def get_workflow_runs(
+        self,
+        status: str = "failure",
+        max_results: int = 10,
+        since: Optional[Union[date, str]] = None,
+        branch: Optional[str] = None
+    ) -> List[Dict]:
         """
         Fetch workflow runs from the repository
         
+        Filters are applied server-side and pagination stops as soon as
+        max_results runs have been collected.
+        
         Args:
             status: Filter by status (failure, success, in_progress, etc.)
             max_results: Maximum number of results to return
+            since: Only runs created on or after this date (date or YYYY-MM-DD)
+            branch: Only runs triggered on this branch
             
         Returns:
             List of workflow run information
@@ -56,14 +94,22 @@ class GitHubIntegration:
             logger.error("Repository not initialized")
             return []
         
+        if max_results <= 0:
+            return []
+        
+        filters = {"status": status}
+        if since:
+            if isinstance(since, date):
+                since = since.isoformat()
+            filters["created"] = f">={since}"
+        if branch:
+            filters["branch"] = branch
+        
         try:
-            runs = self.repo.get_workflow_runs(status=status)
+            runs = self.repo.get_workflow_runs(**filters)
             results = []
             
-            for i, run in enumerate(runs):
-                if i >= max_results:
-                    break
-                
+            for run in runs:
                 results.append({
                     "id": run.id,
                     "name": run.name,
@@ -76,6 +122,10 @@ class GitHubIntegration:
                     "html_url": run.html_url,
                     "logs_url": run.logs_url
                 })
+                
+                # Stop before the paginator requests another page
+                if len(results) >= max_results:
+                    break
             
             logger.info(f"Retrieved {len(results)} workflow run(s) with status '{status}'")
             return results
@@ -84,42 +134,129 @@ class GitHubIntegration:
             logger.error(f"Failed to fetch workflow runs: {e}")
             return []
     
-    def get_workflow_logs(self, run_id: int) -> Optional[str]:
+    def get_workflow_logs(self, run_id: int, logs_url: Optional[str] = None) -> Optional[str]:
         """
         Fetch logs for a specific workflow run
         
         Args:
             run_id: The workflow run ID
+            logs_url: Logs URL from get_workflow_runs, saves looking the run up again
             
         Returns:
             Log content as string or None if failed
         """
+        lines = list(self.iter_log_lines(run_id, logs_url))
+        return '\n'.join(lines) if lines else None
+    
+    def iter_log_lines(self, run_id: int, logs_url: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream the log lines of a workflow run, one step file at a time
+        
+        The logs endpoint returns a zip archive with one text file per job
+        step. The archive is downloaded in chunks and each file is decoded
+        lazily, so only the current line is held as text.
+        
+        Args:
+            run_id: The workflow run ID
+            logs_url: Logs URL from get_workflow_runs, saves looking the run up again
+            
+        Yields:
+            Log lines without trailing newlines
+        """
+        archive = self._download_log_archive(run_id, logs_url)
+        if archive is None:
+            return
+        
+        with archive:
+            archive.seek(0)
+            try:
+                zf = zipfile.ZipFile(archive)
+            except zipfile.BadZipFile:
+                # Not an archive (e.g. a plain-text log), stream it as-is
+                archive.seek(0)
+                with io.TextIOWrapper(archive, encoding='utf-8', errors='replace') as text:
+                    for line in text:
+                        yield line.rstrip('\r\n')
+                return
+            
+            with zf:
+                for info in zf.infolist():
+                    if info.is_dir():
+                        continue
+                    with zf.open(info) as raw:
+                        with io.TextIOWrapper(raw, encoding='utf-8', errors='replace') as text:
+                            for line in text:
+                                yield line.rstrip('\r\n')
+    
+    def _download_log_archive(self, run_id: int, logs_url: Optional[str]) -> Optional[BinaryIO]:
+        """
+        Download the log archive of a run into a seekable file
+        
+        Repeat fetches send the stored ETag as If-None-Match; a 304 reuses the
+        archive kept from the previous download and costs no transfer.
+        
+        Args:
+            run_id: The workflow run ID
+            logs_url: Logs URL, looked up from the run when not given
+            
+        Returns:
+            Open binary file (seek before reading), or None if failed
+        """
         if not self.repo:
             logger.error("Repository not initialized")
             return None
         
+        archive = None
         try:
-            run = self.repo.get_workflow_run(run_id)
-            logs_url = run.logs_url
+            if not logs_url:
+                logs_url = self.repo.get_workflow_run(run_id).logs_url
             
-            # Download logs using requests
+            # Download logs over the shared session
             headers = {"Authorization": f"Bearer {self.token}"}
-            response = requests.get(logs_url, headers=headers, allow_redirects=True)
+            cached = self._log_cache.get(run_id)
+            if cached:
+                headers["If-None-Match"] = cached[0]
             
-            if response.status_code == 200:
-                logger.info(f"Successfully fetched logs for run {run_id}")
-                # Note: GitHub API returns logs as a zip archive
-                # For production use, you would extract and parse the zip file
-                # For now, returning the raw content as text for basic analysis
-                return response.text
-            else:
-                logger.error(f"Failed to fetch logs: HTTP {response.status_code}")
-                return None
+            with self.session.get(logs_url, headers=headers, allow_redirects=True, stream=True) as response:
+                if response.status_code == 304 and cached:
+                    logger.info(f"Logs for run {run_id} unchanged, using cached copy")
+                    return open(cached[1], 'rb')
+                
+                if response.status_code != 200:
+                    logger.error(f"Failed to fetch logs: HTTP {response.status_code}")
+                    return None
                 
-        except (GithubException, requests.RequestException) as e:
+                # ZipFile needs a seekable file; the raw socket stream is not
+                etag = response.headers.get("ETag")
+                if etag:
+                    path = os.path.join(self._get_log_cache_dir(), f"{run_id}.zip")
+                    archive = open(path + ".part", 'w+b')
+                else:
+                    archive = tempfile.SpooledTemporaryFile(max_size=_LOG_SPOOL_SIZE)
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, archive)
+            
+            if etag:
+                # Only a complete download replaces the cached archive
+                os.replace(path + ".part", path)
+                self._log_cache[run_id] = (etag, path)
+            
+            logger.info(f"Successfully fetched logs for run {run_id}")
+            return archive
+            
+        except (GithubException, requests.RequestException, OSError) as e:
             logger.error(f"Failed to fetch workflow logs: {e}")
+            if archive is not None:
+                archive.close()
             return None
     
+    def _get_log_cache_dir(self) -> str:
+        """Directory holding cached log archives, created on first use"""
+        if self._log_cache_dir is None:
+            self._log_cache_dir = tempfile.mkdtemp(prefix="workflow-logs-")
+            weakref.finalize(self, shutil.rmtree, self._log_cache_dir, True)
+        return self._log_cache_dir
+    
     def get_workflow_jobs(self, run_id: int) -> List[Dict]:
         """
         Get jobs for a specific workflow run
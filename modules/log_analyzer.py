@@ -4,7 +4,7 @@ Parses logs and categorizes errors
 """
 import re
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from loguru import logger
 
 
@@ -89,6 +89,13 @@ class ErrorPattern:
     }
 
 
+# Categories that explain a failure on their own; streamed analysis can stop at the first one
+BLOCKING_CATEGORIES = frozenset({
+    ErrorCategory.YAML_SYNTAX_ERROR,
+    ErrorCategory.MISSING_DEPENDENCY,
+})
+
+
 class LogAnalyzer:
     """Analyzes workflow logs to identify and categorize errors"""
     
@@ -102,6 +109,27 @@ class LogAnalyzer:
         Args:
             log_content: The raw log content from workflow run
             
+        Returns:
+            Dictionary containing error analysis results
+        """
+        if not log_content:
+            logger.warning("Empty log content provided")
+            return self.analyze_lines(())
+        
+        return self.analyze_lines(log_content.split('\n'))
+    
+    def analyze_lines(
+        self,
+        log_lines: Iterable[str],
+        stop_categories: Optional[Iterable[ErrorCategory]] = None
+    ) -> Dict[str, any]:
+        """
+        Analyze log lines as they arrive, e.g. from GitHubIntegration.iter_log_lines
+        
+        Args:
+            log_lines: Iterable of log lines
+            stop_categories: Stop reading once an error in one of these categories is found
+            
         Returns:
             Dictionary containing error analysis results
         """
@@ -111,14 +139,7 @@ class LogAnalyzer:
             "categories": set(),
             "summary": ""
         }
-        
-        if not log_content:
-            logger.warning("Empty log content provided")
-            result["summary"] = "No errors detected in the log"
-            return result
-        
-        # Split log into lines for analysis
-        log_lines = log_content.split('\n')
+        stop_categories = frozenset(stop_categories or ())
         
         # Analyze each line
         for line_num, line in enumerate(log_lines, 1):
@@ -131,6 +152,8 @@ class LogAnalyzer:
                     "category": category.value,
                 })
                 result["categories"].add(category.value)
+                if category in stop_categories:
+                    break
         
         # Convert set to list for JSON serialization
         result["categories"] = list(result["categories"])
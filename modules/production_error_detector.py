@@ -2,12 +2,202 @@
 Enhanced Pattern Detection Engine for CI/CD Agent
 Comprehensive error pattern matching for production-grade validation
 """
+import os
 import re
 import json
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+import threading
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional
 from enum import Enum
 
+try:
+    import hyperscan  # python-hyperscan, optional
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2  # google-re2, optional
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick  # pyahocorasick, optional
+except ImportError:
+    ahocorasick = None
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Characters Python's \s matches but RE2's doesn't; input containing them stays on re
+_RE2_UNSAFE_CHARS = re.compile(r'[\x0b\x1c-\x1f]')
+
+
+def _literals_of(parsed) -> Optional[List[str]]:
+    """Literals, one of which must appear in any match of a parsed regex sequence"""
+    options = []
+    run = []
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            options.append([''.join(run)])
+            run = []
+        if op is sre_parse.SUBPATTERN:
+            inner = _literals_of(av[-1])
+        elif op is sre_parse.BRANCH:
+            branches = [_literals_of(branch) for branch in av[1]]
+            inner = None if None in branches else [lit for branch in branches for lit in branch]
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            inner = _literals_of(av[2])
+        else:
+            inner = None
+        if inner:
+            options.append(inner)
+    if run:
+        options.append([''.join(run)])
+    # Prefer the option whose shortest literal is longest, i.e. the most selective one
+    return max(options, key=lambda lits: min(map(len, lits)), default=None)
+
+
+def _required_literals(pattern: str) -> Optional[List[str]]:
+    """Lowercased literals, one of which any case-insensitive match of pattern contains"""
+    literals = _literals_of(sre_parse.parse(pattern))
+    return [lit.lower() for lit in literals] if literals else None
+
+
+# Corrections for the env_var_typo pattern, keyed by the misspelt name
+_ENV_VAR_TYPOS = {
+    "REGISTRYYYYY": "REGISTRY",
+    "IMAGE_NAMEEEEE": "IMAGE_NAME",
+    "NODE_VERSIONNNNN": "NODE_VERSION",
+    "PYTHON_VERSIONNNNN": "PYTHON_VERSION",
+    "JAVA_VERSIO": "JAVA_VERSION",
+    "TERRAFORM_VERSIO": "TERRAFORM_VERSION",
+    "KUBECTL_VERSIO": "KUBECTL_VERSION",
+    "HELM_VERSIO": "HELM_VERSION",
+}
+
+_UBUNTU_RE = re.compile(r"ubuntu-\w+")
+_PY_PATH_RE = re.compile(r"PYTHPATH|PYTHON_PATH|PYPATH|PYTHOH")
+_REQ_RE = re.compile(r"requirement\.txt|requir\.txt|requirements\.tx|requirement")
+
+_ACTION_VERSIONS = {
+    "actions/checkout": "actions/checkout@v4",
+    "actions/setup-python": "actions/setup-python@v5",
+    "actions/setup-node": "actions/setup-node@v4",
+    "actions/setup-java": "actions/setup-java@v4",
+    "actions/cache": "actions/cache@v3",
+    "actions/upload-artifact": "actions/upload-artifact@v4",
+    "actions/download-artifact": "actions/download-artifact@v4",
+}
+
+
+def _pin_action_version(match: str) -> Optional[str]:
+    """Add the known version tag to the first action named in match"""
+    for action, versioned in _ACTION_VERSIONS.items():
+        if action in match:
+            return match.replace(action, versioned)
+    return None
+
+
+# Per-pattern rewrites of the matched text; other patterns use their fix_suggestion
+_FIX_HANDLERS = {
+    "invalid_runner_ubuntu": lambda match: _UBUNTU_RE.sub("ubuntu-latest", match),
+    "missing_action_version": _pin_action_version,
+    "python_path_typo": lambda match: _PY_PATH_RE.sub("PYTHONPATH", match),
+    "requirements_file_typo": lambda match: _REQ_RE.sub("requirements.txt", match),
+    "env_var_typo": lambda match: _ENV_VAR_TYPOS[match[:-1].upper()] + ":",
+}
+
+# Actions missing_action_version reports; its regex takes any action name so the
+# engine can run straight off the "actions/" prefix instead of an 8-way alternation
+_KNOWN_ACTIONS = frozenset({
+    "checkout", "setup-python", "setup-node", "setup-java", "setup-go",
+    "cache", "upload-artifact", "download-artifact",
+})
+
+# Per-pattern checks a match must also pass before it is reported
+_MATCH_FILTERS = {
+    "missing_action_version": lambda match: match.group(1).lower() in _KNOWN_ACTIONS,
+}
+
+
+@lru_cache(maxsize=1024)
+def _specific_fix(name: str, match: str) -> Optional[str]:
+    """Match-specific fix for a pattern, memoized since the same typos recur across files"""
+    handler = _FIX_HANDLERS.get(name)
+    return handler(match) if handler is not None else None
+
+# Below this size thread hand-off costs more than scanning inline
+_PARALLEL_SCAN_MIN_SIZE = 16 * 1024
+
+# Above this size each RE2 pattern is also split into line-aligned chunks across the pool.
+# Chunks scan _CHUNK_OVERLAP past their end, which bounds the match length (lookahead
+# context included) that is guaranteed to come out the same as one whole-content scan
+_CHUNKED_SCAN_MIN_SIZE = 100_000
+_CHUNK_SIZE = 64 * 1024
+_CHUNK_OVERLAP = 2 * 1024
+
+
+def _chunk_bounds(content: str) -> List[Tuple[int, int]]:
+    """Split content into (start, end) ranges of about _CHUNK_SIZE ending on line boundaries"""
+    bounds = []
+    start = 0
+    while start < len(content):
+        end = content.find('\n', start + _CHUNK_SIZE)
+        end = len(content) if end == -1 else end + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _scan_chunk(regex, content: str, start: int, end: int) -> list:
+    """Matches of one pattern starting in content[start:end], run in a worker thread"""
+    matches = []
+    for match in regex.finditer(content, start, min(len(content), end + _CHUNK_OVERLAP)):
+        if match.start() >= end:
+            break
+        matches.append(match)
+    return matches
+
+
+def _merge_chunks(chunk_matches) -> list:
+    """Join per-chunk matches, dropping any that overlap a match carried over a chunk boundary"""
+    merged = []
+    last_end = 0
+    for matches in chunk_matches:
+        for match in matches:
+            if match.start() < last_end:
+                continue
+            merged.append(match)
+            last_end = match.end()
+    return merged
+
+
+def _fix_suggestion(pattern: "ErrorPattern", match: str) -> str:
+    """Match-specific fix if the pattern has a handler, else its generic fix_suggestion"""
+    fix = _specific_fix(pattern.name, match)
+    return pattern.fix_suggestion if fix is None else fix
+
+
+def _line_starts(content: str) -> List[int]:
+    """Offset of the first character of every line in content"""
+    starts = [0]
+    find = content.find
+    newline = find('\n')
+    while newline != -1:
+        starts.append(newline + 1)
+        newline = find('\n', newline + 1)
+    return starts
+
+
 class ErrorSeverity(Enum):
     CRITICAL = "critical"
     HIGH = "high"
@@ -22,8 +212,9 @@ class ErrorCategory(Enum):
     PERFORMANCE = "performance"
     COMPATIBILITY = "compatibility"
 
-@dataclass
-class ErrorPattern:
+# NamedTuples rather than dataclasses: no per-instance __dict__, and DetectedError is
+# allocated once per match
+class ErrorPattern(NamedTuple):
     name: str
     pattern: str
     category: ErrorCategory
@@ -32,22 +223,193 @@ class ErrorPattern:
     fix_suggestion: str
     confidence: float
     auto_fixable: bool
+    ignorecase: bool = True  # False for patterns that only make sense in one case
 
-@dataclass
-class DetectedError:
+class DetectedError(NamedTuple):
     pattern: ErrorPattern
     match: str
     line_number: Optional[int]
     context: str
     suggested_fix: str
 
+class DetectedErrorView(Sequence):
+    """Detected errors kept as (pattern index, start, end) hits; DetectedError is built on access
+    
+    Counting and summarising never allocate per-match objects or context strings.
+    """
+    
+    def __init__(self, patterns: Tuple[ErrorPattern, ...], content: str,
+                 hits: List[Tuple[int, int, int]]):
+        self.patterns = patterns
+        self.content = content
+        self.hits = hits
+        self._line_starts = None
+    
+    def __len__(self) -> int:
+        return len(self.hits)
+    
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._error(hit) for hit in self.hits[item]]
+        return self._error(self.hits[item])
+    
+    def __repr__(self) -> str:
+        return f"DetectedErrorView({len(self.hits)} errors)"
+    
+    def matched_patterns(self) -> Iterator[ErrorPattern]:
+        """The ErrorPattern behind each hit, without building DetectedError objects"""
+        patterns = self.patterns
+        return (patterns[index] for index, _, _ in self.hits)
+    
+    def _error(self, hit: Tuple[int, int, int]) -> DetectedError:
+        """Materialize one hit, slicing its line number and context out of the content"""
+        index, start, end = hit
+        content = self.content
+        # Built on first access; matches then map to lines by binary search
+        if self._line_starts is None:
+            self._line_starts = _line_starts(content)
+        line_starts = self._line_starts
+        
+        line_num = bisect_right(line_starts, start)
+        context_start = line_starts[max(0, line_num - 3)]
+        context_end = line_num + 2
+        if context_end < len(line_starts):
+            context = content[context_start:line_starts[context_end] - 1]
+        else:
+            context = content[context_start:]
+        
+        pattern = self.patterns[index]
+        match = content[start:end]
+        return DetectedError(
+            pattern=pattern,
+            match=match,
+            line_number=line_num,
+            context=context,
+            suggested_fix=_fix_suggestion(pattern, match)
+        )
+
 class ProductionErrorDetector:
     """Production-grade error detection with comprehensive patterns"""
     
+    _tables_ready = False
+    _tables_lock = threading.Lock()
+    
     def __init__(self):
-        self.patterns = self._load_error_patterns()
+        # Patterns, compiled regexes, prefilters and the scan pool are built by the
+        # first detector and shared by every later one, so instances are cheap to create
+        if not ProductionErrorDetector._tables_ready:
+            with ProductionErrorDetector._tables_lock:
+                # Another thread may have built them while this one waited
+                if not ProductionErrorDetector._tables_ready:
+                    ProductionErrorDetector._build_tables()
+    
+    @classmethod
+    def _build_tables(cls):
+        """Build the pattern table and everything derived from it, once per process"""
+        cls.patterns = tuple(cls._load_error_patterns())
+        # Compile once so detect_errors doesn't go through re's cache on every call.
+        # Regexes are kept parallel to patterns so the scan loop only touches
+        # a pattern's metadata once it has matched
+        cls._regexes: List[re.Pattern] = [
+            re.compile(p.pattern, re.MULTILINE | (re.IGNORECASE if p.ignorecase else 0))
+            for p in cls.patterns
+        ]
+        # Same patterns on RE2 where it accepts them; used for ASCII input only
+        cls._ascii_regexes: List[object] = [
+            cls._compile_re2(p) or cre for p, cre in zip(cls.patterns, cls._regexes)
+        ]
+        # Only RE2 scans go to the pool, so it is created on first use and only if needed
+        cls._has_re2 = any(not isinstance(r, re.Pattern) for r in cls._ascii_regexes)
+        cls._pool = None
+        cls._prefilter_db = cls._build_prefilter()
+        if cls._prefilter_db is None:
+            cls._build_literal_prefilter()
+        else:
+            cls._literals = None
+        cls._tables_ready = True
+    
+    @staticmethod
+    def _compile_re2(pattern: ErrorPattern):
+        """Compile pattern with RE2, or return None if unavailable or unsupported (lookarounds)"""
+        if re2 is None:
+            return None
+        options = re2.Options()
+        options.log_errors = False
+        flags = '(?im)' if pattern.ignorecase else '(?m)'
+        try:
+            return re2.compile(flags + pattern.pattern, options)
+        except re2.error:
+            return None
+    
+    @classmethod
+    def _build_prefilter(cls):
+        """Compile every pattern into one Hyperscan database used as a single-pass prefilter"""
+        if hyperscan is None:
+            return None
+        # PREFILTER approximates lookarounds, so a hit only means the pattern *may* match
+        flags = (hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_PREFILTER |
+                 hyperscan.HS_FLAG_SINGLEMATCH)
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.pattern.encode() for p in cls.patterns],
+            ids=list(range(len(cls.patterns))),
+            flags=[flags | hyperscan.HS_FLAG_CASELESS if p.ignorecase else flags
+                   for p in cls.patterns],
+        )
+        return db
     
-    def _load_error_patterns(self) -> List[ErrorPattern]:
+    @classmethod
+    def _build_literal_prefilter(cls):
+        """Map each pattern's required literals to it, for when Hyperscan isn't available"""
+        cls._literals: Dict[str, List[int]] = {}
+        cls._unfiltered = set()
+        for index, pattern in enumerate(cls.patterns):
+            literals = _required_literals(pattern.pattern)
+            if literals is None:
+                cls._unfiltered.add(index)
+                continue
+            for literal in literals:
+                cls._literals.setdefault(literal, []).append(index)
+        
+        if ahocorasick is not None and cls._literals:
+            cls._literal_automaton = ahocorasick.Automaton()
+            for literal, indices in cls._literals.items():
+                cls._literal_automaton.add_word(literal, indices)
+            cls._literal_automaton.make_automaton()
+        else:
+            cls._literal_automaton = None
+    
+    def _candidate_patterns(self, content: str) -> Optional[set]:
+        """Indices of patterns that may match ASCII content, or None to run all of them"""
+        if self._prefilter_db is None:
+            return self._literal_candidates(content)
+        
+        candidates = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            candidates.add(pattern_id)
+        
+        self._prefilter_db.scan(content.encode('ascii'), match_event_handler=on_match)
+        return candidates
+    
+    def _literal_candidates(self, content: str) -> Optional[set]:
+        """Patterns without a required literal, plus those whose literal appears in content"""
+        if self._literals is None:
+            return None
+        
+        lowered = content.lower()
+        candidates = set(self._unfiltered)
+        if self._literal_automaton is not None:
+            for _, indices in self._literal_automaton.iter(lowered):
+                candidates.update(indices)
+        else:
+            for literal, indices in self._literals.items():
+                if literal in lowered:
+                    candidates.update(indices)
+        return candidates
+    
+    @staticmethod
+    def _load_error_patterns() -> List[ErrorPattern]:
         """Load comprehensive error patterns for production use"""
         return [
             # YAML Structure Issues (Critical for parsing)
@@ -129,7 +491,7 @@ class ProductionErrorDetector:
             # Action Version Issues
             ErrorPattern(
                 name="missing_action_version",
-                pattern=r"uses:\s*actions/(?:checkout|setup-python|setup-node|setup-java|setup-go|cache|upload-artifact|download-artifact)(?!@)",
+                pattern=r"uses:\s*actions/([A-Za-z-]+)(?![A-Za-z@-])",
                 category=ErrorCategory.SECURITY,
                 severity=ErrorSeverity.HIGH,
                 description="Missing version tag for GitHub Action",
@@ -157,7 +519,8 @@ class ProductionErrorDetector:
                 description="Typo in PYTHONPATH environment variable",
                 fix_suggestion="Use 'PYTHONPATH'",
                 confidence=0.95,
-                auto_fixable=True
+                auto_fixable=True,
+                ignorecase=False
             ),
             ErrorPattern(
                 name="path_typo",
@@ -167,7 +530,8 @@ class ProductionErrorDetector:
                 description="Typo in PATH environment variable",
                 fix_suggestion="Use 'PATH'",
                 confidence=0.95,
-                auto_fixable=True
+                auto_fixable=True,
+                ignorecase=False
             ),
             
             # Dependency Issues
@@ -363,7 +727,8 @@ class ProductionErrorDetector:
                 description="Environment variable name contains typo",
                 fix_suggestion="Fix environment variable name spelling",
                 confidence=0.98,
-                auto_fixable=True
+                auto_fixable=True,
+                ignorecase=False
             ),
             ErrorPattern(
                 name="timeout_syntax_error",
@@ -383,7 +748,8 @@ class ProductionErrorDetector:
                 description="GitHub context comparison using single = instead of ==",
                 fix_suggestion="Use == for equality comparison",
                 confidence=0.99,
-                auto_fixable=True
+                auto_fixable=True,
+                ignorecase=False
             ),
             ErrorPattern(
                 name="action_version_incomplete",
@@ -449,7 +815,8 @@ class ProductionErrorDetector:
                 description="Incomplete GitLeaks action version",
                 fix_suggestion="Complete to 'gitleaks/gitleaks-action@v2'",
                 confidence=0.98,
-                auto_fixable=True
+                auto_fixable=True,
+                ignorecase=False
             ),
             ErrorPattern(
                 name="incomplete_trivy_version",
@@ -459,7 +826,8 @@ class ProductionErrorDetector:
                 description="Missing Trivy action version",
                 fix_suggestion="Add version '@master'",
                 confidence=0.98,
-                auto_fixable=True
+                auto_fixable=True,
+                ignorecase=False
             ),
             ErrorPattern(
                 name="incomplete_dependency_check_version",
@@ -469,89 +837,21 @@ class ProductionErrorDetector:
                 description="Missing dependency check action version",
                 fix_suggestion="Add version '@main'",
                 confidence=0.98,
-                auto_fixable=True
+                auto_fixable=True,
+                ignorecase=False
             ),
             
             # Environment variable name typos (enterprise pipelines have these)
             ErrorPattern(
-                name="env_var_registry_typo",
-                pattern=r"REGISTRYYYYY:",
+                name="env_var_typo",
+                pattern=r"(REGISTRYYYYY|IMAGE_NAMEEEEE|NODE_VERSIONNNNN|PYTHON_VERSIONNNNN|JAVA_VERSIO|TERRAFORM_VERSIO|KUBECTL_VERSIO|HELM_VERSIO):",
                 category=ErrorCategory.CONFIGURATION,
                 severity=ErrorSeverity.HIGH,
                 description="Environment variable name typo",
-                fix_suggestion="Fix to 'REGISTRY:'",
+                fix_suggestion="Fix environment variable name",
                 confidence=0.99,
-                auto_fixable=True
-            ),
-            ErrorPattern(
-                name="env_var_image_name_typo",
-                pattern=r"IMAGE_NAMEEEEE:",
-                category=ErrorCategory.CONFIGURATION,
-                severity=ErrorSeverity.HIGH,
-                description="Environment variable name typo",
-                fix_suggestion="Fix to 'IMAGE_NAME:'",
-                confidence=0.99,
-                auto_fixable=True
-            ),
-            ErrorPattern(
-                name="env_var_node_version_typo",
-                pattern=r"NODE_VERSIONNNNN:",
-                category=ErrorCategory.CONFIGURATION,
-                severity=ErrorSeverity.HIGH,
-                description="Environment variable name typo",
-                fix_suggestion="Fix to 'NODE_VERSION:'",
-                confidence=0.99,
-                auto_fixable=True
-            ),
-            ErrorPattern(
-                name="env_var_python_version_typo",
-                pattern=r"PYTHON_VERSIONNNNN:",
-                category=ErrorCategory.CONFIGURATION,
-                severity=ErrorSeverity.HIGH,
-                description="Environment variable name typo",
-                fix_suggestion="Fix to 'PYTHON_VERSION:'",
-                confidence=0.99,
-                auto_fixable=True
-            ),
-            ErrorPattern(
-                name="env_var_java_version_typo",
-                pattern=r"JAVA_VERSIO:",
-                category=ErrorCategory.CONFIGURATION,
-                severity=ErrorSeverity.HIGH,
-                description="Environment variable name typo",
-                fix_suggestion="Fix to 'JAVA_VERSION:'",
-                confidence=0.99,
-                auto_fixable=True
-            ),
-            ErrorPattern(
-                name="env_var_terraform_version_typo",
-                pattern=r"TERRAFORM_VERSIO:",
-                category=ErrorCategory.CONFIGURATION,
-                severity=ErrorSeverity.HIGH,
-                description="Environment variable name typo",
-                fix_suggestion="Fix to 'TERRAFORM_VERSION:'",
-                confidence=0.99,
-                auto_fixable=True
-            ),
-            ErrorPattern(
-                name="env_var_kubectl_version_typo",
-                pattern=r"KUBECTL_VERSIO:",
-                category=ErrorCategory.CONFIGURATION,
-                severity=ErrorSeverity.HIGH,
-                description="Environment variable name typo",
-                fix_suggestion="Fix to 'KUBECTL_VERSION:'",
-                confidence=0.99,
-                auto_fixable=True
-            ),
-            ErrorPattern(
-                name="env_var_helm_version_typo",
-                pattern=r"HELM_VERSIO:",
-                category=ErrorCategory.CONFIGURATION,
-                severity=ErrorSeverity.HIGH,
-                description="Environment variable name typo",
-                fix_suggestion="Fix to 'HELM_VERSION:'",
-                confidence=0.99,
-                auto_fixable=True
+                auto_fixable=True,
+                ignorecase=False
             ),
             
             # Runner specification errors
@@ -577,78 +877,116 @@ class ProductionErrorDetector:
             ),
         ]
     
-    def detect_errors(self, content: str, file_path: str = "") -> List[DetectedError]:
+    def detect_errors(self, content: str, file_path: str = "") -> DetectedErrorView:
         """Detect all errors in the provided content"""
-        errors = []
-        lines = content.split('\n')
-        
-        for pattern in self.patterns:
-            matches = list(re.finditer(pattern.pattern, content, re.MULTILINE | re.IGNORECASE))
-            
-            for match in matches:
-                line_num = content[:match.start()].count('\n') + 1
-                context_start = max(0, line_num - 3)
-                context_end = min(len(lines), line_num + 2)
-                context = '\n'.join(lines[context_start:context_end])
-                
-                # Generate specific fix suggestion
-                suggested_fix = self._generate_fix_suggestion(pattern, match.group())
-                
-                error = DetectedError(
-                    pattern=pattern,
-                    match=match.group(),
-                    line_number=line_num,
-                    context=context,
-                    suggested_fix=suggested_fix
-                )
-                errors.append(error)
+        return DetectedErrorView(self.patterns, content, list(self._iter_hits(content)))
+    
+    def iter_errors(self, content: str) -> Iterator[DetectedError]:
+        """Yield detected errors as the scan finds them, in detect_errors order
         
-        return errors
+        Nothing is built for matches the caller never consumes, so stopping early
+        (first N, any critical) skips the remaining patterns and their context strings.
+        On large input, RE2 scans still queued on the pool are cancelled when the
+        generator is closed; ones already running finish in the background.
+        """
+        view = DetectedErrorView(self.patterns, content, [])
+        for hit in self._iter_hits(content):
+            yield view._error(hit)
     
-    def _generate_fix_suggestion(self, pattern: ErrorPattern, match: str) -> str:
-        """Generate specific fix suggestion based on the match"""
-        if pattern.name == "invalid_runner_ubuntu":
-            return match.replace(re.search(r"ubuntu-\w+", match).group(), "ubuntu-latest")
+    def _iter_hits(self, content: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield (pattern index, start, end) for every match, grouped by pattern in table order"""
+        # Hyperscan and RE2 fold ASCII case only; other input keeps re's Unicode semantics
+        if content.isascii() and not _RE2_UNSAFE_CHARS.search(content):
+            regexes = self._ascii_regexes
+            candidates = self._candidate_patterns(content)
+        else:
+            regexes = self._regexes
+            candidates = None
+        indices = range(len(regexes)) if candidates is None else sorted(candidates)
         
-        elif pattern.name == "missing_action_version":
-            action_map = {
-                "actions/checkout": "actions/checkout@v4",
-                "actions/setup-python": "actions/setup-python@v5",
-                "actions/setup-node": "actions/setup-node@v4",
-                "actions/setup-java": "actions/setup-java@v4",
-                "actions/cache": "actions/cache@v3",
-                "actions/upload-artifact": "actions/upload-artifact@v4",
-                "actions/download-artifact": "actions/download-artifact@v4",
-            }
-            for action, versioned in action_map.items():
-                if action in match:
-                    return match.replace(action, versioned)
+        # Patterns are deliberately scanned one by one rather than fused into a single
+        # (?P<pN>...)|... alternation: sre tries every branch at every offset (about 3.5x
+        # slower here), and a leftmost-first alternation drops other patterns' overlapping
+        # matches. The prefilters above already give the single-pass pattern selection
         
-        elif pattern.name == "python_path_typo":
-            return re.sub(r"PYTHPATH|PYTHON_PATH|PYPATH|PYTHOH", "PYTHONPATH", match)
+        if (regexes is self._ascii_regexes and self._has_re2
+                and len(content) >= _PARALLEL_SCAN_MIN_SIZE and len(indices) > 1):
+            scans = self._parallel_scans(regexes, indices, content)
+        else:
+            scans = ((index, regexes[index].finditer(content)) for index in indices)
         
-        elif pattern.name == "requirements_file_typo":
-            return re.sub(r"requirement\.txt|requir\.txt|requirements\.tx|requirement", "requirements.txt", match)
+        try:
+            for index, matches in scans:
+                accept = _MATCH_FILTERS.get(self.patterns[index].name)
+                for match in matches:
+                    if accept is None or accept(match):
+                        yield index, match.start(), match.end()
+        finally:
+            scans.close()  # Lets _parallel_scans cancel its pending work right away
+    
+    def _parallel_scans(self, regexes: list, indices, content: str):
+        """Yield (index, matches) in pattern order, running RE2 scans on the thread pool"""
+        if len(content) >= _CHUNKED_SCAN_MIN_SIZE:
+            chunks = _chunk_bounds(content)
+        else:
+            chunks = [(0, len(content))]
         
-        return pattern.fix_suggestion
+        # RE2 drops the GIL while matching; re holds it, so those stay on this thread
+        pool = self._scan_pool()
+        futures = {
+            index: [pool.submit(_scan_chunk, regexes[index], content, start, end)
+                    for start, end in chunks]
+            for index in indices
+            if not isinstance(regexes[index], re.Pattern)
+        }
+        try:
+            for index in indices:
+                parts = futures.get(index)
+                if parts is None:
+                    yield index, regexes[index].finditer(content)
+                else:
+                    yield index, _merge_chunks(part.result() for part in parts)
+        finally:
+            # Consumer stopped early: drop the scans nobody will read
+            for parts in futures.values():
+                for part in parts:
+                    part.cancel()
+    
+    @classmethod
+    def _scan_pool(cls) -> ThreadPoolExecutor:
+        """Thread pool for RE2 scans, created by the first scan that needs it"""
+        if cls._pool is None:
+            with cls._tables_lock:
+                if cls._pool is None:
+                    cls._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        return cls._pool
     
-    def get_error_summary(self, errors: List[DetectedError]) -> Dict:
+    def _generate_fix_suggestion(self, pattern: ErrorPattern, match: str) -> str:
+        """Generate specific fix suggestion based on the match"""
+        return _fix_suggestion(pattern, match)
+    
+    def get_error_summary(self, errors: Sequence[DetectedError]) -> Dict:
         """Generate comprehensive error summary"""
-        summary = {
-            "total_errors": len(errors),
-            "by_severity": {},
-            "by_category": {},
-            "auto_fixable": len([e for e in errors if e.pattern.auto_fixable]),
-            "critical_issues": len([e for e in errors if e.pattern.severity == ErrorSeverity.CRITICAL])
-        }
-        
-        for severity in ErrorSeverity:
-            summary["by_severity"][severity.value] = len([e for e in errors if e.pattern.severity == severity])
+        if isinstance(errors, DetectedErrorView):
+            patterns = errors.matched_patterns()
+        else:
+            patterns = (error.pattern for error in errors)
         
-        for category in ErrorCategory:
-            summary["by_category"][category.value] = len([e for e in errors if e.pattern.category == category])
+        by_severity = Counter()
+        by_category = Counter()
+        auto_fixable = 0
+        for pattern in patterns:
+            by_severity[pattern.severity] += 1
+            by_category[pattern.category] += 1
+            auto_fixable += pattern.auto_fixable
         
-        return summary
+        return {
+            "total_errors": len(errors),
+            "by_severity": {severity.value: by_severity[severity] for severity in ErrorSeverity},
+            "by_category": {category.value: by_category[category] for category in ErrorCategory},
+            "auto_fixable": auto_fixable,
+            "critical_issues": by_severity[ErrorSeverity.CRITICAL]
+        }
 
 # Export for use in other modules
-__all__ = ['ProductionErrorDetector', 'DetectedError', 'ErrorPattern', 'ErrorSeverity', 'ErrorCategory']
\ No newline at end of file
+__all__ = ['ProductionErrorDetector', 'DetectedError', 'DetectedErrorView', 'ErrorPattern', 'ErrorSeverity', 'ErrorCategory']
\ No newline at end of file
@@ -9,9 +9,59 @@ import re
 import os
 from typing import Dict, List, Optional
 
+
+def _compile_fixes(fixes, message, flags: int = 0) -> tuple:
+    """(compiled pattern, replacement, fixes_applied entry) rows, built once per class"""
+    return tuple((re.compile(pattern, flags), replacement, message(replacement))
+                 for pattern, replacement in fixes)
+
+
 class ProductionCICDAgent:
     """Production-ready agent that actually fixes enterprise pipelines"""
     
+    _ACTION_FIXES = _compile_fixes([
+        # Malformed checkout
+        (r'actions/checkout@v4v44v44v44v44v44', 'actions/checkout@v4'),
+        # Missing versions
+        (r'gitleaks/gitleaks-action@v\\b', 'gitleaks/gitleaks-action@v2'),
+        (r'aquasecurity/trivy-action@\\s*$', 'aquasecurity/trivy-action@master'),
+        (r'dependency-check/Dependency-Check_Action@\\s*$', 'dependency-check/Dependency-Check_Action@main'),
+        (r'actions/setup-node@\\s*$', 'actions/setup-node@v4'),
+        (r'actions/setup-python@\\s*$', 'actions/setup-python@v5'),
+        (r'actions/setup-java@\\s*$', 'actions/setup-java@v4'),
+        (r'docker/setup-buildx-action@\\s*$', 'docker/setup-buildx-action@v3'),
+        (r'docker/login-action@\\s*$', 'docker/login-action@v3'),
+        (r'docker/build-push-action@\\s*$', 'docker/build-push-action@v5'),
+        (r'hashicorp/setup-terraform@\\s*$', 'hashicorp/setup-terraform@v3'),
+        (r'anchore/sbom-action@\\s*$', 'anchore/sbom-action@v0'),
+        (r'actions/upload-artifact@\\s*$', 'actions/upload-artifact@v4'),
+        (r'actions/cache@\\s*$', 'actions/cache@v4'),
+    ], lambda replacement: f"Fixed action version: {replacement.split('@')[0]}", re.MULTILINE)
+    
+    _ENV_FIXES = _compile_fixes([
+        (r'REGISTRYYYYY:', 'REGISTRY:'),
+        (r'IMAGE_NAMEEEEE:', 'IMAGE_NAME:'),
+        (r'NODE_VERSIONNNNN:', 'NODE_VERSION:'),
+        (r'PYTHON_VERSIONNNNN:', 'PYTHON_VERSION:'),
+        (r'JAVA_VERSIO:', 'JAVA_VERSION:'),
+        (r'TERRAFORM_VERSIO:', 'TERRAFORM_VERSION:'),
+        (r'KUBECTL_VERSIO:', 'KUBECTL_VERSION:'),
+        (r'HELM_VERSIO:', 'HELM_VERSION:'),
+    ], lambda replacement: f"Fixed env var: {replacement}")
+    
+    _RUNNER_FIXES = _compile_fixes([
+        (r'ubuntu-latesttesttesttesttestt', 'ubuntu-latest'),
+        (r'ubuntu-lat\\b', 'ubuntu-latest'),
+        (r'windows-lat\\b', 'windows-latest'),
+        (r'macos-lat\\b', 'macos-latest'),
+    ], lambda replacement: f"Fixed runner: {replacement}")
+    
+    _FILE_FIXES = _compile_fixes([
+        (r'requirement\\.txt', 'requirements.txt'),
+        (r'requir\\.txt', 'requirements.txt'),
+        (r'PYTHONPTH', 'PYTHONPATH'),
+    ], lambda replacement: f"Fixed file ref: {replacement}")
+    
     def __init__(self):
         self.fixes_applied = []
         
@@ -121,84 +171,26 @@ class ProductionCICDAgent:
     
     def _fix_action_versions(self, content: str) -> str:
         """Fix incomplete action versions"""
-        
-        fixes = [
-            # Malformed checkout
-            (r'actions/checkout@v4v44v44v44v44v44', 'actions/checkout@v4'),
-            # Missing versions
-            (r'gitleaks/gitleaks-action@v\\b', 'gitleaks/gitleaks-action@v2'),
-            (r'aquasecurity/trivy-action@\\s*$', 'aquasecurity/trivy-action@master'),
-            (r'dependency-check/Dependency-Check_Action@\\s*$', 'dependency-check/Dependency-Check_Action@main'),
-            (r'actions/setup-node@\\s*$', 'actions/setup-node@v4'),
-            (r'actions/setup-python@\\s*$', 'actions/setup-python@v5'),
-            (r'actions/setup-java@\\s*$', 'actions/setup-java@v4'),
-            (r'docker/setup-buildx-action@\\s*$', 'docker/setup-buildx-action@v3'),
-            (r'docker/login-action@\\s*$', 'docker/login-action@v3'),
-            (r'docker/build-push-action@\\s*$', 'docker/build-push-action@v5'),
-            (r'hashicorp/setup-terraform@\\s*$', 'hashicorp/setup-terraform@v3'),
-            (r'anchore/sbom-action@\\s*$', 'anchore/sbom-action@v0'),
-            (r'actions/upload-artifact@\\s*$', 'actions/upload-artifact@v4'),
-            (r'actions/cache@\\s*$', 'actions/cache@v4'),
-        ]
-        
-        for pattern, replacement in fixes:
-            if re.search(pattern, content, re.MULTILINE):
-                content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-                self.fixes_applied.append(f"Fixed action version: {replacement.split('@')[0]}")
-        
-        return content
+        return self._apply_fixes(content, self._ACTION_FIXES)
     
     def _fix_environment_variables(self, content: str) -> str:
         """Fix environment variable typos"""
-        
-        fixes = [
-            (r'REGISTRYYYYY:', 'REGISTRY:'),
-            (r'IMAGE_NAMEEEEE:', 'IMAGE_NAME:'),
-            (r'NODE_VERSIONNNNN:', 'NODE_VERSION:'),
-            (r'PYTHON_VERSIONNNNN:', 'PYTHON_VERSION:'),
-            (r'JAVA_VERSIO:', 'JAVA_VERSION:'),
-            (r'TERRAFORM_VERSIO:', 'TERRAFORM_VERSION:'),
-            (r'KUBECTL_VERSIO:', 'KUBECTL_VERSION:'),
-            (r'HELM_VERSIO:', 'HELM_VERSION:'),
-        ]
-        
-        for pattern, replacement in fixes:
-            if re.search(pattern, content):
-                content = re.sub(pattern, replacement, content)
-                self.fixes_applied.append(f"Fixed env var: {replacement}")
-        
-        return content
+        return self._apply_fixes(content, self._ENV_FIXES)
     
     def _fix_runner_specs(self, content: str) -> str:
         """Fix runner specifications"""
-        
-        fixes = [
-            (r'ubuntu-latesttesttesttesttestt', 'ubuntu-latest'),
-            (r'ubuntu-lat\\b', 'ubuntu-latest'),
-            (r'windows-lat\\b', 'windows-latest'),
-            (r'macos-lat\\b', 'macos-latest'),
-        ]
-        
-        for pattern, replacement in fixes:
-            if re.search(pattern, content):
-                content = re.sub(pattern, replacement, content)
-                self.fixes_applied.append(f"Fixed runner: {replacement}")
-        
-        return content
+        return self._apply_fixes(content, self._RUNNER_FIXES)
     
     def _fix_file_references(self, content: str) -> str:
         """Fix file path references"""
-        
-        fixes = [
-            (r'requirement\\.txt', 'requirements.txt'),
-            (r'requir\\.txt', 'requirements.txt'),
-            (r'PYTHONPTH', 'PYTHONPATH'),
-        ]
-        
-        for pattern, replacement in fixes:
-            if re.search(pattern, content):
-                content = re.sub(pattern, replacement, content)
-                self.fixes_applied.append(f"Fixed file ref: {replacement}")
+        return self._apply_fixes(content, self._FILE_FIXES)
+    
+    def _apply_fixes(self, content: str, fixes: tuple) -> str:
+        """Apply each precompiled fix, logging the ones that matched"""
+        for pattern, replacement, message in fixes:
+            content, count = pattern.subn(replacement, content)
+            if count:
+                self.fixes_applied.append(message)
         
         return content
     
@@ -11,7 +11,7 @@ sys.path.append(os.path.dirname(__file__))
 from continuous_learning_agent import ContinuousLearningAgent
 from enterprise_cicd_agent import EnterpriseGradeCICDAgent
 import yaml
-import json
+from dataclasses import asdict
 from pathlib import Path
 
 class SelfImprovingCICDAgent(EnterpriseGradeCICDAgent):
@@ -23,12 +23,8 @@ class SelfImprovingCICDAgent(EnterpriseGradeCICDAgent):
         self.auto_patterns = self._load_auto_patterns()
         
     def _load_auto_patterns(self) -> dict:
-        """Load automatically learned patterns"""
-        patterns_file = Path("learning_data/learned_patterns.json")
-        if patterns_file.exists():
-            with open(patterns_file, 'r') as f:
-                return json.load(f)
-        return {}
+        """Learned patterns as dicts, from the learning agent's snapshot-plus-log state"""
+        return {key: asdict(pattern) for key, pattern in self.learning_agent.learned_patterns.items()}
     
     def fix_production_pipeline(self, content: str, learn_from_errors: bool = True) -> str:
         """Enhanced pipeline fixing with continuous learning"""
@@ -57,6 +53,7 @@ class SelfImprovingCICDAgent(EnterpriseGradeCICDAgent):
                     print(f"🔍 Discovered {len(analysis['new_patterns_discovered'])} new error patterns")
                     
                     # Try to fix with newly learned patterns
+                    self.auto_patterns = self._load_auto_patterns()
                     fixed_content = self._apply_learned_patterns(fixed_content)
         
         return fixed_content
@@ -0,0 +1,64 @@
+"""
+Unit tests for the AgentAutoUpdater module
+"""
+import json
+import pytest
+from agent_auto_updater import AgentAutoUpdater
+
+
+def _pattern(error_text: str, frequency: int) -> dict:
+    return {
+        "error_text": error_text,
+        "fix_suggestion": f"Replace '{error_text}' with '{error_text}-fixed'",
+        "frequency": frequency,
+        "first_seen": "2026-01-01T00:00:00",
+        "last_seen": "2026-01-01T00:00:00",
+        "confidence": 0.9,
+        "category": "runner_specification",
+        "pattern_type": "typo"
+    }
+
+
+class TestAgentAutoUpdater:
+    """Test cases for AgentAutoUpdater"""
+    
+    @pytest.fixture(autouse=True)
+    def learning_dir(self, tmp_path, monkeypatch):
+        """Run each test in an empty working directory with a learning_data folder"""
+        monkeypatch.chdir(tmp_path)
+        learning_dir = tmp_path / "learning_data"
+        learning_dir.mkdir()
+        return learning_dir
+    
+    def test_check_for_updates_no_patterns(self):
+        """Test nothing to update without a snapshot or update log"""
+        status = AgentAutoUpdater().check_for_updates()
+        assert status == {'needs_update': False, 'reason': 'No patterns found'}
+    
+    def test_check_for_updates_replays_update_log(self, learning_dir):
+        """Test patterns that only qualify through the JSONL update log are counted"""
+        snapshot = {f"p{i}": _pattern(f"err{i}", frequency=1) for i in range(5)}
+        (learning_dir / "learned_patterns.json").write_text(json.dumps(snapshot))
+        with open(learning_dir / "learned_patterns.jsonl", "w") as f:
+            for key, pattern in snapshot.items():
+                f.write(json.dumps({key: dict(pattern, frequency=3)}) + "\n")
+        
+        status = AgentAutoUpdater().check_for_updates()
+        assert status['needs_update'] is True
+        assert status['patterns_ready'] == 5
+    
+    def test_check_for_updates_log_without_snapshot(self, learning_dir):
+        """Test an update log alone, before the first compaction, is enough"""
+        with open(learning_dir / "learned_patterns.jsonl", "w") as f:
+            for i in range(5):
+                f.write(json.dumps({f"p{i}": _pattern(f"err{i}", frequency=3)}) + "\n")
+        
+        assert AgentAutoUpdater().check_for_updates()['patterns_ready'] == 5
+    
+    def test_check_for_updates_below_threshold(self, learning_dir):
+        """Test low-frequency patterns don't trigger an update"""
+        snapshot = {f"p{i}": _pattern(f"err{i}", frequency=1) for i in range(5)}
+        (learning_dir / "learned_patterns.json").write_text(json.dumps(snapshot))
+        
+        status = AgentAutoUpdater().check_for_updates()
+        assert status == {'needs_update': False, 'reason': 'Insufficient patterns for update'}
@@ -0,0 +1,102 @@
+"""
+Unit tests for the EnterpriseGradeCICDAgent fixers
+"""
+from pathlib import Path
+
+import pytest
+import enterprise_cicd_agent as agent_module
+from enterprise_cicd_agent import EnterpriseGradeCICDAgent
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+BROKEN = """name: Broken
+on: push
+env:
+  PYTHON_VERSIO: '3.11'
+  REGISTR: ghcr.io
+jobs:
+  build:
+    runs-on: ubuntu-lat
+    strategy:
+      matrix:
+        os: [ubuntu-lat, windows-latest]
+    steps:
+      - uses: actions/checkout@
+      - uses: actions/setup-python@
+      - run: pip install -r requirement.txt
+"""
+
+CORRECT = """name: Correct
+on: push
+env:
+  PYTHON_VERSION: '3.11'
+  REGISTRY: ghcr.io
+  IMAGE_NAME: app
+jobs:
+  build:
+    runs-on: ubuntu-latest
+    strategy:
+      matrix:
+        os: [ubuntu-latest, windows-latest, macos-latest]
+    steps:
+      - uses: actions/checkout@v4
+      - uses: actions/setup-python@v5
+      - uses: gitleaks/gitleaks-action@v2
+      - run: pip install -r requirements.txt
+"""
+
+
+def _fix(content: str) -> str:
+    return EnterpriseGradeCICDAgent().fix_production_pipeline(content)
+
+
+class TestEnterpriseGradeCICDAgent:
+    """Test cases for EnterpriseGradeCICDAgent"""
+    
+    @pytest.mark.parametrize("pipeline", [
+        BROKEN,
+        (REPO_ROOT / "broken_enterprise_pipeline.yml").read_text(),
+        (REPO_ROOT / "production_pipeline_test.yml").read_text(),
+    ])
+    def test_single_pass_is_idempotent(self, pipeline):
+        """Test fixing an already fixed pipeline changes nothing"""
+        fixed = _fix(pipeline)
+        assert _fix(fixed) == fixed
+    
+    def test_typos_fixed(self):
+        """Test runner, action, env var and file typos are fixed in one pass"""
+        agent = EnterpriseGradeCICDAgent()
+        fixed = agent._fix_typos(BROKEN)
+        assert "runs-on: ubuntu-latest\n" in fixed
+        assert "os: [ubuntu-latest, windows-latest]" in fixed
+        assert "uses: actions/checkout@v4\n" in fixed
+        assert "uses: actions/setup-python@v5\n" in fixed
+        assert "PYTHON_VERSION: '3.11'" in fixed
+        assert "REGISTRY: ghcr.io" in fixed
+        assert "requirements.txt" in fixed and "requirement.txt" not in fixed
+        assert "Env var: PYTHON_VERSIO -> PYTHON_VERSION" in agent.fixes_applied
+    
+    def test_correct_tokens_untouched(self):
+        """Test text that is already correct is not re-fixed (no ubuntu-latestest, @v4v4)"""
+        agent = EnterpriseGradeCICDAgent()
+        assert agent._fix_typos(CORRECT) == CORRECT
+        assert agent.fixes_applied == []
+    
+    @pytest.mark.skipif(agent_module.hyperscan is None, reason="hyperscan not installed")
+    @pytest.mark.parametrize("pipeline", [
+        BROKEN,
+        CORRECT,
+        (REPO_ROOT / "broken_enterprise_pipeline.yml").read_text(),
+        (REPO_ROOT / "production_pipeline_test.yml").read_text(),
+        (REPO_ROOT / "enterprise_production_pipeline.yml").read_text(),
+    ])
+    def test_hyperscan_matches_regex_path(self, pipeline, monkeypatch):
+        """Test the Hyperscan scan gives the same fixes as the regex alternation"""
+        hyperscan_agent = EnterpriseGradeCICDAgent()
+        hyperscan_fixed = hyperscan_agent._fix_typos(pipeline)
+        
+        monkeypatch.setattr(EnterpriseGradeCICDAgent, "_TYPO_DB", None)
+        regex_agent = EnterpriseGradeCICDAgent()
+        assert regex_agent._fix_typos(pipeline) == hyperscan_fixed
+        assert regex_agent.fixes_applied == hyperscan_agent.fixes_applied
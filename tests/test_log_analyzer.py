@@ -2,7 +2,7 @@
 Unit tests for the LogAnalyzer module
 """
 import pytest
-from modules.log_analyzer import LogAnalyzer, ErrorCategory
+from modules.log_analyzer import LogAnalyzer, ErrorCategory, BLOCKING_CATEGORIES
 
 
 class TestLogAnalyzer:
@@ -70,6 +70,18 @@ Access denied - 403 Forbidden
         assert result["has_errors"] is True
         assert "permission_error" in result["categories"]
     
+    def test_analyze_lines_stops_at_blocking_category(self):
+        """Test that streamed analysis stops at the first blocking error"""
+        lines = iter([
+            "Error: Job timed out after 60 minutes",
+            "ModuleNotFoundError: No module named 'requests'",
+            "AssertionError: never read",
+        ])
+        result = self.analyzer.analyze_lines(lines, stop_categories=BLOCKING_CATEGORIES)
+        assert set(result["categories"]) == {"timeout_error", "missing_dependency"}
+        assert len(result["errors"]) == 2
+        assert next(lines) == "AssertionError: never read"
+    
     def test_categorize_error_unknown(self):
         """Test that unknown errors are categorized correctly"""
         result = self.analyzer._categorize_error("Some random log line")
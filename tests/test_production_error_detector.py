@@ -0,0 +1,126 @@
+"""
+Unit tests for the ProductionErrorDetector module
+"""
+import pytest
+import modules.production_error_detector as detector_module
+from modules.production_error_detector import ProductionErrorDetector, ErrorSeverity
+
+
+WORKFLOW = """on: push
+jobs:
+  build:
+    runs-on: ubuntu-lat
+    steps:
+      - uses: actions/checkout
+      - uses: actions/setup-python@v5
+      - run: pip install -r requirement.txt
+env:
+  REGISTRYYYYY: ghcr.io
+  HELM_VERSIO: 3
+"""
+
+
+@pytest.fixture
+def rebuild_pure_re(monkeypatch):
+    """Callable rebuilding the shared tables as if hyperscan, re2 and pyahocorasick were missing"""
+    before = dict(vars(ProductionErrorDetector))
+    
+    def rebuild():
+        for name in ("hyperscan", "re2", "ahocorasick"):
+            monkeypatch.setattr(detector_module, name, None)
+        ProductionErrorDetector._build_tables()
+    
+    yield rebuild
+    
+    # Put back the tables every other test shares
+    for name in list(vars(ProductionErrorDetector)):
+        if name not in before:
+            delattr(ProductionErrorDetector, name)
+    for name, value in before.items():
+        if vars(ProductionErrorDetector).get(name) is not value:
+            setattr(ProductionErrorDetector, name, value)
+
+
+class TestProductionErrorDetector:
+    """Test cases for ProductionErrorDetector"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.detector = ProductionErrorDetector()
+    
+    def _found(self, errors):
+        return [(e.pattern.name, e.match, e.line_number) for e in errors]
+    
+    def test_detects_known_errors_with_line_numbers(self):
+        """Test detected errors carry the matched text and its line"""
+        found = self._found(self.detector.detect_errors(WORKFLOW))
+        assert ("invalid_runner_ubuntu", "runs-on: ubuntu-lat", 4) in found
+        assert ("missing_action_version", "uses: actions/checkout", 6) in found
+        assert ("env_var_typo", "REGISTRYYYYY:", 10) in found
+        assert ("env_var_typo", "HELM_VERSIO:", 11) in found
+    
+    def test_versioned_action_not_reported(self):
+        """Test actions with a version tag are not reported as unversioned"""
+        errors = self.detector.detect_errors(WORKFLOW)
+        assert all("setup-python" not in e.match for e in errors
+                   if e.pattern.name == "missing_action_version")
+    
+    def test_suggested_fixes(self):
+        """Test match-specific fix suggestions"""
+        fixes = {(e.pattern.name, e.match): e.suggested_fix
+                 for e in self.detector.detect_errors(WORKFLOW)}
+        assert fixes["invalid_runner_ubuntu", "runs-on: ubuntu-lat"] == "runs-on: ubuntu-latest"
+        assert fixes["missing_action_version", "uses: actions/checkout"] == "uses: actions/checkout@v4"
+        assert fixes["env_var_typo", "REGISTRYYYYY:"] == "REGISTRY:"
+    
+    def test_context_surrounds_match(self):
+        """Test context holds the lines around the match"""
+        error = next(e for e in self.detector.detect_errors(WORKFLOW)
+                     if e.pattern.name == "invalid_runner_ubuntu")
+        assert error.context == "jobs:\n  build:\n    runs-on: ubuntu-lat\n    steps:\n      - uses: actions/checkout"
+    
+    def test_iter_errors_matches_detect_errors(self):
+        """Test the streaming API yields the same errors in the same order"""
+        assert list(self.detector.iter_errors(WORKFLOW)) == list(self.detector.detect_errors(WORKFLOW))
+    
+    def test_non_ascii_content_matches_ascii_path(self):
+        """Test non-ASCII input, which bypasses the prefilters, finds the same errors"""
+        ascii_found = self._found(self.detector.detect_errors(WORKFLOW))
+        unicode_found = self._found(self.detector.detect_errors(WORKFLOW + "# café\n"))
+        assert unicode_found == ascii_found
+    
+    def test_chunked_scan_matches_whole_scan(self, monkeypatch):
+        """Test large inputs scanned in chunks give the same result as one pass"""
+        content = WORKFLOW * 400
+        whole = self._found(self.detector.detect_errors(content))
+        monkeypatch.setattr(detector_module, "_CHUNKED_SCAN_MIN_SIZE", 0)
+        monkeypatch.setattr(detector_module, "_CHUNK_SIZE", 1024)
+        monkeypatch.setattr(detector_module, "_CHUNK_OVERLAP", 256)
+        assert self._found(self.detector.detect_errors(content)) == whole
+    
+    def test_error_summary(self):
+        """Test summary counts from the lazy view and from a plain list agree"""
+        errors = self.detector.detect_errors(WORKFLOW)
+        summary = self.detector.get_error_summary(errors)
+        assert summary == self.detector.get_error_summary(list(errors))
+        assert summary["total_errors"] == len(errors)
+        assert sum(summary["by_severity"].values()) == len(errors)
+        assert summary["critical_issues"] == summary["by_severity"][ErrorSeverity.CRITICAL.value]
+    
+    def test_clean_content(self):
+        """Test content without findings"""
+        errors = self.detector.detect_errors("name: clean\n")
+        assert len(errors) == 0
+        assert self.detector.get_error_summary(errors)["total_errors"] == 0
+    
+    def test_pure_re_fallback_matches_accelerated_path(self, rebuild_pure_re):
+        """Test the plain-re path, without optional packages, finds the same errors"""
+        contents = (WORKFLOW, WORKFLOW + "# café\n", WORKFLOW * 400)
+        expected = [self._found(self.detector.detect_errors(content)) for content in contents]
+        
+        rebuild_pure_re()
+        detector = ProductionErrorDetector()
+        assert detector._prefilter_db is None
+        assert detector._literal_automaton is None
+        assert not detector._has_re2
+        assert [self._found(detector.detect_errors(content)) for content in contents] == expected
@@ -0,0 +1,49 @@
+"""
+Unit tests for the SelfImprovingCICDAgent learned-pattern loading
+"""
+import json
+import pytest
+from self_improving_agent import SelfImprovingCICDAgent
+
+
+def _pattern(error_text: str, fix_suggestion: str, frequency: int, confidence: float) -> dict:
+    return {
+        "error_text": error_text,
+        "fix_suggestion": fix_suggestion,
+        "frequency": frequency,
+        "first_seen": "2026-01-01T00:00:00",
+        "last_seen": "2026-01-01T00:00:00",
+        "confidence": confidence,
+        "category": "runner_specification",
+        "pattern_type": "typo"
+    }
+
+
+class TestSelfImprovingCICDAgent:
+    """Test cases for SelfImprovingCICDAgent"""
+    
+    @pytest.fixture(autouse=True)
+    def learning_dir(self, tmp_path, monkeypatch):
+        """Run each test in an empty working directory with a learning_data folder"""
+        monkeypatch.chdir(tmp_path)
+        learning_dir = tmp_path / "learning_data"
+        learning_dir.mkdir()
+        return learning_dir
+    
+    def test_auto_patterns_include_update_log(self, learning_dir):
+        """Test auto_patterns reflect the JSONL log replayed over the snapshot"""
+        pattern = _pattern("runs-on: linux-box", "Replace 'linux-box' with 'ubuntu-latest'", 1, 0.5)
+        (learning_dir / "learned_patterns.json").write_text(json.dumps({"p": pattern}))
+        with open(learning_dir / "learned_patterns.jsonl", "w") as f:
+            f.write(json.dumps({"p": dict(pattern, frequency=3, confidence=0.9)}) + "\n")
+        
+        agent = SelfImprovingCICDAgent()
+        assert agent.auto_patterns["p"]["frequency"] == 3
+        
+        # Only the log lifts the pattern above the confidence cut-off
+        fixed = agent._apply_learned_patterns("runs-on: linux-box\n")
+        assert fixed == "runs-on: ubuntu-latest\n"
+    
+    def test_auto_patterns_empty_without_learning_data(self):
+        """Test no learned patterns when nothing has been learned yet"""
+        assert SelfImprovingCICDAgent().auto_patterns == {}